@@ -1,51 +1,121 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import functools
 import json
+import mmap
 import os
 import re
-import select
+import selectors
 import subprocess
+import tempfile
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib codec produces the same documents
+    orjson = None  # type: ignore[assignment]
+
+# orjson turns integers beyond 64 bits into floats, so lines with a run of 19+
+# digits (found by a C-speed translate to "0"/" ") are decoded by json instead.
+DIGIT_MASK = bytes(0x30 if 0x30 <= b <= 0x39 else 0x20 for b in range(256))
+WIDE_INT_RUN = b"0" * 19
+
+
+def json_loads(data: bytes) -> Any:
+    # Same documents as json.loads: orjson is only used where it is exact, and
+    # anything it rejects (NaN/Infinity literals, say) is retried with json.
+    if orjson is not None and WIDE_INT_RUN not in data.translate(DIGIT_MASK):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 TUTORIAL_DIR = Path(__file__).resolve().parents[1]
 WORKSPACE_ROOT = Path(__file__).resolve().parents[5]
 INPUTS_PATH = TUTORIAL_DIR / "inputs" / "cases.json"
 OUTPUTS_DIR = TUTORIAL_DIR / "outputs"
+SUMMARY_PATH = OUTPUTS_DIR / "summary.json"
+CONVERSATION_PATH = OUTPUTS_DIR / "conversation-inspection.json"
+# Subprocess cwd and summary paths, converted once rather than per call.
+WORKSPACE_DIR = str(WORKSPACE_ROOT)
+# Upper bound on stderr read after a timed-out command has been killed.
+STDERR_DRAIN_LIMIT = 1 << 20
 
 
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def write_json(path: Path, data: Any) -> None:
-    sanitized = sanitize_for_output(data)
-    path.write_text(json.dumps(sanitized, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+def write_json(path: Path, data: Any, *, pretty: bool = False) -> None:
+    # Per-test results are machine-read and written compact; only files meant to be
+    # opened by hand are indented.
+    path.write_bytes(json_dumps(sanitize_for_output(data), pretty=pretty))
 
 
+def json_dumps(value: Any, *, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        options = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            options |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, option=options)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits or lone surrogates, which json writes
+            pass
+    if pretty:
+        text = json.dumps(value, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    # backslashreplace turns a lone surrogate into its \uXXXX JSON escape.
+    return (text + "\n").encode("utf-8", errors="backslashreplace")
+
+
+WORKSPACE_PREFIX = str(WORKSPACE_ROOT.resolve())
+HOME_PREFIX = str(Path.home().resolve())
+
 SECRET_KEY_HINTS = ("api_key", "apikey", "token", "secret", "password", "auth")
-SECRET_VALUE_PATTERNS = [
-    re.compile(r"\bsk-[A-Za-z0-9_-]{16,}\b"),
-    re.compile(r"(?i)\bBearer\s+[A-Za-z0-9._~-]{16,}\b"),
-]
+SECRET_KEY_RE = re.compile("|".join(re.escape(hint) for hint in SECRET_KEY_HINTS))
+SECRET_VALUE_PATTERNS = (
+    r"\bsk-[A-Za-z0-9_-]{16,}\b",
+    r"(?i:\bBearer\s+[A-Za-z0-9._~-]{16,}\b)",
+)
+MASK_REPLACEMENTS = {
+    "workspace_root": "<WORKSPACE_ROOT>",
+    "home": "<HOME>",
+    "secret": "<REDACTED>",
+}
+
+
+def build_mask_pattern() -> re.Pattern[str]:
+    # One alternation so each string is walked once; the workspace root is listed
+    # before home so it wins when both match at the same position.
+    alternatives: list[str] = []
+    if WORKSPACE_PREFIX:
+        alternatives.append(f"(?P<workspace_root>{re.escape(WORKSPACE_PREFIX)})")
+    if HOME_PREFIX:
+        alternatives.append(f"(?P<home>{re.escape(HOME_PREFIX)})")
+    alternatives.append("(?P<secret>" + "|".join(SECRET_VALUE_PATTERNS) + ")")
+    return re.compile("|".join(alternatives))
+
+
+MASK_PATTERN = build_mask_pattern()
+
+
+def mask_replacement(match: re.Match[str]) -> str:
+    return MASK_REPLACEMENTS[match.lastgroup or "secret"]
 
 
 def mask_string_value(value: str) -> str:
-    masked = value
-    workspace_root = str(WORKSPACE_ROOT.resolve())
-    home_dir = str(Path.home().resolve())
-    if workspace_root:
-        masked = masked.replace(workspace_root, "<WORKSPACE_ROOT>")
-    if home_dir:
-        masked = masked.replace(home_dir, "<HOME>")
-    for pattern in SECRET_VALUE_PATTERNS:
-        masked = pattern.sub("<REDACTED>", masked)
-    return masked
+    return MASK_PATTERN.sub(mask_replacement, value)
 
 
 def sanitize_for_output(value: Any, key_hint: str = "") -> Any:
@@ -53,7 +123,7 @@ def sanitize_for_output(value: Any, key_hint: str = "") -> Any:
         sanitized: dict[str, Any] = {}
         for key, item in value.items():
             key_lower = str(key).lower()
-            if any(hint in key_lower for hint in SECRET_KEY_HINTS) and isinstance(item, str):
+            if isinstance(item, str) and SECRET_KEY_RE.search(key_lower):
                 sanitized[key] = "<REDACTED>"
             else:
                 sanitized[key] = sanitize_for_output(item, key_lower)
@@ -61,7 +131,7 @@ def sanitize_for_output(value: Any, key_hint: str = "") -> Any:
     if isinstance(value, list):
         return [sanitize_for_output(item, key_hint) for item in value]
     if isinstance(value, str):
-        if any(hint in key_hint for hint in SECRET_KEY_HINTS):
+        if key_hint and SECRET_KEY_RE.search(key_hint):
             return "<REDACTED>"
         return mask_string_value(value)
     return value
@@ -78,45 +148,36 @@ def is_exact_match(actual: Any, expected: str) -> bool:
 
 
 def unique_keep_order(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for value in values:
-        if value not in seen:
-            seen.add(value)
-            ordered.append(value)
-    return ordered
+    return list(dict.fromkeys(values))
 
 
 def find_codex_candidates() -> list[str]:
-    proc = subprocess.run(
-        ["bash", "-lc", "which -a codex || true"],
-        cwd=str(WORKSPACE_ROOT),
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-    lines = [line.strip() for line in proc.stdout.splitlines() if line.strip()]
-    return unique_keep_order(lines)
+    # Same result as `which -a codex`, without forking a login shell.
+    candidates: list[str] = []
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if not directory:
+            continue
+        candidate = os.path.join(directory, "codex")
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            candidates.append(candidate)
+    return unique_keep_order(candidates)
 
 
 def pick_host_codex(candidates: list[str]) -> str | None:
-    workspace_prefix = str(WORKSPACE_ROOT.resolve())
+    workspace_dir = WORKSPACE_PREFIX + os.sep
     for candidate in candidates:
-        try:
-            resolved = str(Path(candidate).resolve())
-        except OSError:
-            resolved = candidate
-        if not resolved.startswith(workspace_prefix + os.sep):
+        if not os.path.realpath(candidate).startswith(workspace_dir):
             return candidate
     if candidates:
         return candidates[0]
     return None
 
 
+@functools.lru_cache(maxsize=8)
 def read_version(codex_path: str) -> str:
     proc = subprocess.run(
         [codex_path, "--version"],
-        cwd=str(WORKSPACE_ROOT),
+        cwd=WORKSPACE_DIR,
         text=True,
         capture_output=True,
         check=False,
@@ -127,15 +188,21 @@ def read_version(codex_path: str) -> str:
     return proc.stderr.strip()
 
 
-def exec_supports_flag(codex_path: str, flag: str) -> bool:
+@functools.lru_cache(maxsize=8)
+def read_exec_help(codex_path: str) -> str:
     proc = subprocess.run(
         [codex_path, "exec", "--help"],
-        cwd=str(WORKSPACE_ROOT),
+        cwd=WORKSPACE_DIR,
         text=True,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=False,
     )
-    return flag in proc.stdout
+    return proc.stdout
+
+
+def exec_supports_flag(codex_path: str, flag: str) -> bool:
+    return flag in read_exec_help(codex_path)
 
 
 def run_command(
@@ -147,22 +214,84 @@ def run_command(
 ) -> dict[str, Any]:
     started = time.time()
     start_iso = utc_now()
+    # codex writes its event stream straight into an anonymous temp file, so a long
+    # session never has to fit in memory; the caller owns and closes stdout_file.
+    stdout_file = tempfile.TemporaryFile()
     proc = subprocess.Popen(
         cmd,
-        cwd=str(WORKSPACE_ROOT),
+        cwd=WORKSPACE_DIR,
         env=env,
-        text=True,
         stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
+        stdout=stdout_file,
         stderr=subprocess.PIPE,
     )
+    assert proc.stdin is not None and proc.stderr is not None
+    # Feed the prompt and collect stderr from one selector loop on the raw fds,
+    # instead of the writer/reader threads communicate() would start.
+    stdin_fd = proc.stdin.fileno()
+    stderr_fd = proc.stderr.fileno()
+    pending = memoryview(stdin_text.encode("utf-8"))
+    stderr_buf = bytearray()
+    deadline = time.monotonic() + timeout_sec
     timed_out = False
-    try:
-        stdout, stderr = proc.communicate(stdin_text, timeout=timeout_sec)
-    except subprocess.TimeoutExpired:
-        timed_out = True
+    with selectors.DefaultSelector() as selector:
+        os.set_blocking(stderr_fd, False)
+        selector.register(stderr_fd, selectors.EVENT_READ)
+        if pending:
+            os.set_blocking(stdin_fd, False)
+            selector.register(stdin_fd, selectors.EVENT_WRITE)
+        else:
+            proc.stdin.close()
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            for key, _ in selector.select(timeout=remaining):
+                if key.fd == stdin_fd:
+                    try:
+                        pending = pending[os.write(stdin_fd, pending) :]
+                    except BlockingIOError:
+                        continue
+                    except BrokenPipeError:
+                        pending = pending[:0]
+                    if not pending:
+                        selector.unregister(stdin_fd)
+                        proc.stdin.close()
+                    continue
+                try:
+                    chunk = os.read(stderr_fd, 65536)
+                except BlockingIOError:
+                    continue
+                if chunk:
+                    stderr_buf.extend(chunk)
+                else:
+                    selector.unregister(stderr_fd)
+    if not timed_out:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+    if timed_out:
         proc.kill()
-        stdout, stderr = proc.communicate()
+        proc.wait()
+        # Drain what the killed process left in the pipe, up to EOF.  Reads stay
+        # non-blocking and capped, so a surviving grandchild holding the pipe
+        # open cannot stall or flood the drain.
+        drained = 0
+        while drained < STDERR_DRAIN_LIMIT:
+            try:
+                chunk = os.read(stderr_fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            stderr_buf.extend(chunk)
+            drained += len(chunk)
+    if not proc.stdin.closed:
+        proc.stdin.close()
+    proc.stderr.close()
+    stderr = stderr_buf.decode("utf-8", errors="replace")
     end_iso = utc_now()
     return {
         "cmd": cmd,
@@ -171,63 +300,97 @@ def run_command(
         "duration_sec": round(time.time() - started, 3),
         "timed_out": timed_out,
         "returncode": proc.returncode,
-        "stdout": stdout,
+        "stdout_file": stdout_file,
         "stderr": stderr,
     }
 
 
-def parse_jsonl(text: str) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    events: list[dict[str, Any]] = []
-    parse_errors: list[dict[str, Any]] = []
-    for line_no, line in enumerate(text.splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped:
+def count_newlines(data: bytes | mmap.mmap, start: int, stop: int) -> int:
+    count = 0
+    nl = data.find(b"\n", start, stop)
+    while nl >= 0:
+        count += 1
+        nl = data.find(b"\n", nl + 1, stop)
+    return count
+
+
+def iter_jsonl(
+    data: bytes | mmap.mmap, parse_errors: list[dict[str, Any]]
+) -> Iterator[dict[str, Any]]:
+    # Events are yielded one at a time so callers can inspect and drop them instead
+    # of holding every decoded dict of a long session; bad lines go to parse_errors.
+    # Scan for newlines in place instead of materializing splitlines(); json.loads
+    # tolerates the surrounding whitespace, so lines are only stripped on error.
+    # Line numbers are only needed for errors, so they are counted lazily from the
+    # previous error position rather than tracked for every line.
+    counted_pos = 0
+    counted_lines = 0
+
+    def record_error(line_start: int, line: bytes, message: str) -> None:
+        nonlocal counted_pos, counted_lines
+        counted_lines += count_newlines(data, counted_pos, line_start)
+        counted_pos = line_start
+        parse_errors.append(
+            {
+                "line_number": counted_lines + 1,
+                "error": message,
+                "preview": line.decode("utf-8", errors="replace").strip()[:200],
+            }
+        )
+
+    pos = 0
+    end = len(data)
+    while pos < end:
+        nl = data.find(b"\n", pos)
+        if nl < 0:
+            nl = end
+        line_start = pos
+        line = data[pos:nl]
+        pos = nl + 1
+        if not line or line.isspace():
             continue
         try:
-            value = json.loads(stripped)
-        except json.JSONDecodeError as err:
-            parse_errors.append(
-                {
-                    "line_number": line_no,
-                    "error": str(err),
-                    "preview": stripped[:200],
-                }
-            )
+            value = json_loads(line)
+        except ValueError as err:
+            record_error(line_start, line, str(err))
             continue
         if isinstance(value, dict):
-            events.append(value)
+            yield value
         else:
-            parse_errors.append(
-                {
-                    "line_number": line_no,
-                    "error": f"json root is {type(value).__name__}, expected object",
-                    "preview": stripped[:200],
-                }
-            )
-    return events, parse_errors
+            record_error(line_start, line, f"json root is {type(value).__name__}, expected object")
 
 
-def find_exec_thread_id(events: list[dict[str, Any]]) -> str | None:
+def scan_exec_events(events: Iterable[dict[str, Any]]) -> tuple[int, str | None, str | None]:
+    event_count = 0
+    thread_id: str | None = None
+    final_message: str | None = None
     for event in events:
-        if event.get("type") == "thread.started":
-            thread_id = event.get("thread_id") or event.get("threadId")
-            if isinstance(thread_id, str) and thread_id:
-                return thread_id
-    return None
-
-
-def find_exec_final_message(events: list[dict[str, Any]]) -> str | None:
-    for event in reversed(events):
-        if event.get("type") != "item.completed":
-            continue
-        item = event.get("item")
-        if not isinstance(item, dict):
-            continue
-        if item.get("type") in {"agent_message", "agentMessage"}:
-            text = item.get("text")
-            if isinstance(text, str):
-                return text
-    return None
+        event_count += 1
+        event_type = event.get("type")
+        if event_type == "item.completed":
+            item = event.get("item")
+            if isinstance(item, dict) and item.get("type") in {"agent_message", "agentMessage"}:
+                text = item.get("text")
+                if isinstance(text, str):
+                    final_message = text
+        elif event_type == "thread.started" and thread_id is None:
+            candidate = event.get("thread_id") or event.get("threadId")
+            if isinstance(candidate, str) and candidate:
+                thread_id = candidate
+    return event_count, thread_id, final_message
+
+
+def sanitize_event_line(line: bytes) -> bytes:
+    # Decoded events get the same key- and value-based redaction as the result
+    # files and are written back compact; lines that are not JSON are masked as
+    # text.
+    if line.isspace():
+        return line
+    try:
+        event = json_loads(line)
+    except ValueError:
+        return mask_string_value(line.decode("utf-8", errors="replace")).encode("utf-8")
+    return json_dumps(sanitize_for_output(event))
 
 
 def make_exec_result(
@@ -237,9 +400,22 @@ def make_exec_result(
     expected: str,
     run: dict[str, Any],
 ) -> dict[str, Any]:
-    events, parse_errors = parse_jsonl(run["stdout"])
-    final_message = find_exec_final_message(events)
-    thread_id = find_exec_thread_id(events)
+    # Keep the event stream next to the results instead of inside them; each line
+    # is sanitized on its own while copying, so the file is never held in memory.
+    raw_events_path = OUTPUTS_DIR / f"raw-{approach}.jsonl"
+    parse_errors: list[dict[str, Any]] = []
+    with run["stdout_file"] as stdout_file:
+        if os.fstat(stdout_file.fileno()).st_size:
+            with mmap.mmap(stdout_file.fileno(), 0, access=mmap.ACCESS_READ) as stdout_view:
+                event_count, thread_id, final_message = scan_exec_events(
+                    iter_jsonl(stdout_view, parse_errors)
+                )
+        else:
+            event_count, thread_id, final_message = 0, None, None
+        stdout_file.seek(0)
+        with raw_events_path.open("wb") as raw_file:
+            for line in stdout_file:
+                raw_file.write(sanitize_event_line(line))
     exact_match = is_exact_match(final_message, expected)
     return {
         "approach": approach,
@@ -253,9 +429,10 @@ def make_exec_result(
         "exact_match": exact_match,
         "thread_id": thread_id,
         "final_message": final_message,
-        "event_count": len(events),
+        "event_count": event_count,
         "json_parse_error_count": len(parse_errors),
         "json_parse_errors": parse_errors[:5],
+        "raw_events_file": str(raw_events_path),
         "stderr_tail": run["stderr"][-2000:],
     }
 
@@ -383,7 +560,8 @@ def test_exec_persistent(codex_path: str, env: dict[str, str], case: dict[str, A
 
 
 def parse_app_server_agent_text(messages: list[dict[str, Any]]) -> str | None:
-    for message in reversed(messages):
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
         if message.get("method") not in {"item/completed", "item.completed"}:
             continue
         params = message.get("params")
@@ -412,6 +590,14 @@ def test_app_server(codex_path: str, env: dict[str, str], case: dict[str, Any])
     thread_id: str | None = None
     turn_id: str | None = None
     final_message: str | None = None
+    # Raw stdout bytes not yet split into frames; scan_pos marks how far the
+    # buffer has already been searched for a newline.
+    stdout_buf = bytearray()
+    scan_pos = 0
+    # stderr is drained on the same selector so a chatty app-server cannot fill
+    # the pipe and block; only a bounded tail is kept for error reporting.
+    stderr_buf = bytearray()
+    selector = selectors.DefaultSelector()
 
     def send_json(payload: dict[str, Any]) -> None:
         if process is None or process.stdin is None:
@@ -419,36 +605,65 @@ def test_app_server(codex_path: str, env: dict[str, str], case: dict[str, Any])
         process.stdin.write(json.dumps(payload) + "\n")
         process.stdin.flush()
 
+    def drain(fd: int, buf: bytearray) -> None:
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                return
+            if not chunk:
+                selector.unregister(fd)
+                return
+            buf.extend(chunk)
+            if buf is stderr_buf and len(stderr_buf) > 8192:
+                del stderr_buf[:-8192]
+
+    def next_frame() -> bytes | None:
+        nonlocal scan_pos
+        nl = stdout_buf.find(b"\n", scan_pos)
+        if nl < 0:
+            scan_pos = len(stdout_buf)
+            return None
+        frame = bytes(stdout_buf[:nl])
+        del stdout_buf[: nl + 1]
+        scan_pos = 0
+        return frame
+
     def read_next_json(timeout: float) -> dict[str, Any]:
         if process is None or process.stdout is None:
             raise RuntimeError("app-server stdout is unavailable")
+        stdout_fd = process.stdout.fileno()
         deadline = time.time() + timeout
-        while time.time() < deadline:
+        while True:
+            frame = next_frame()
+            if frame is not None:
+                if not frame or frame.isspace():
+                    continue
+                try:
+                    msg = json_loads(frame)
+                except ValueError as err:
+                    preview = frame.decode("utf-8", errors="replace").strip()[:200]
+                    parse_errors.append({"error": str(err), "preview": preview})
+                    continue
+                if isinstance(msg, dict):
+                    messages.append(msg)
+                    return msg
+                preview = frame.decode("utf-8", errors="replace").strip()[:200]
+                parse_errors.append({"error": "non-object json message", "preview": preview})
+                continue
+            if time.time() >= deadline:
+                break
             if process.poll() is not None:
-                stderr = process.stderr.read() if process.stderr is not None else ""
+                for key in list(selector.get_map().values()):
+                    drain(key.fd, stdout_buf if key.fd == stdout_fd else stderr_buf)
+                stderr = stderr_buf.decode("utf-8", errors="replace")
                 raise RuntimeError(
                     f"app-server exited early with code {process.returncode}; stderr: {stderr[-2000:]}"
                 )
             remaining = max(0.0, deadline - time.time())
             wait = min(0.25, remaining)
-            ready, _, _ = select.select([process.stdout], [], [], wait)
-            if not ready:
-                continue
-            line = process.stdout.readline()
-            if not line:
-                continue
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                msg = json.loads(stripped)
-            except json.JSONDecodeError as err:
-                parse_errors.append({"error": str(err), "preview": stripped[:200]})
-                continue
-            if isinstance(msg, dict):
-                messages.append(msg)
-                return msg
-            parse_errors.append({"error": "non-object json message", "preview": stripped[:200]})
+            for key, _ in selector.select(timeout=wait):
+                drain(key.fd, stdout_buf if key.fd == stdout_fd else stderr_buf)
         raise TimeoutError(f"timed out waiting for app-server message after {timeout} seconds")
 
     def wait_for(predicate, timeout: float) -> dict[str, Any]:
@@ -462,7 +677,7 @@ def test_app_server(codex_path: str, env: dict[str, str], case: dict[str, Any])
     try:
         process = subprocess.Popen(
             [codex_path, "app-server"],
-            cwd=str(WORKSPACE_ROOT),
+            cwd=WORKSPACE_DIR,
             env=env,
             text=True,
             stdin=subprocess.PIPE,
@@ -470,6 +685,12 @@ def test_app_server(codex_path: str, env: dict[str, str], case: dict[str, Any])
             stderr=subprocess.PIPE,
             bufsize=1,
         )
+        # stdout/stderr are consumed as raw bytes via os.read; never through the
+        # text wrappers.
+        for stream in (process.stdout, process.stderr):
+            if stream is not None:
+                os.set_blocking(stream.fileno(), False)
+                selector.register(stream.fileno(), selectors.EVENT_READ)
         send_json(
             {
                 "id": 1,
@@ -486,7 +707,7 @@ def test_app_server(codex_path: str, env: dict[str, str], case: dict[str, Any])
         wait_for(lambda m: m.get("id") == 1, timeout=45)
         send_json({"method": "initialized", "params": {}})
 
-        send_json({"id": 2, "method": "thread/start", "params": {"cwd": str(WORKSPACE_ROOT)}})
+        send_json({"id": 2, "method": "thread/start", "params": {"cwd": WORKSPACE_DIR}})
         thread_resp = wait_for(lambda m: m.get("id") == 2, timeout=60)
         thread = thread_resp.get("result", {}).get("thread", {})
         if isinstance(thread, dict) and isinstance(thread.get("id"), str):
@@ -525,9 +746,13 @@ def test_app_server(codex_path: str, env: dict[str, str], case: dict[str, Any])
     except Exception as exc:
         error = str(exc)
     finally:
+        selector.close()
         if process is not None:
             if process.stdin is not None and not process.stdin.closed:
-                process.stdin.close()
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
             try:
                 process.terminate()
                 process.wait(timeout=5)
@@ -608,7 +833,7 @@ def main() -> int:
     codex_path = pick_host_codex(candidates)
     if codex_path is None:
         write_json(
-            OUTPUTS_DIR / "summary.json",
+            SUMMARY_PATH,
             {
                 "run_started_utc": utc_now(),
                 "run_finished_utc": utc_now(),
@@ -617,6 +842,7 @@ def main() -> int:
                 "tests": [],
                 "all_success": False,
             },
+            pretty=True,
         )
         print("ERROR: codex not found in PATH")
         return 1
@@ -627,28 +853,35 @@ def main() -> int:
         base_env["CODEX_HOME"] = str(default_codex_home)
 
     run_started = utc_now()
-    tests: list[dict[str, Any]] = []
-
-    exec_stateless = test_exec_stateless(codex_path, base_env, cases["exec_stateless"])
-    tests.append(exec_stateless)
-    write_json(OUTPUTS_DIR / "result-exec-stateless.json", exec_stateless)
-
-    exec_persistent = test_exec_persistent(codex_path, base_env, cases["exec_persistent"])
-    tests.append(exec_persistent)
-    write_json(OUTPUTS_DIR / "result-exec-persistent.json", exec_persistent)
-
-    app_server = test_app_server(codex_path, base_env, cases["app_server"])
-    tests.append(app_server)
-    write_json(OUTPUTS_DIR / "result-app-server.json", app_server)
+    test_plan = [
+        ("exec_stateless", test_exec_stateless, "result-exec-stateless.json"),
+        ("exec_persistent", test_exec_persistent, "result-exec-persistent.json"),
+        ("app_server", test_app_server, "result-app-server.json"),
+    ]
+
+    # The tests only wait on independent codex subprocesses, so run them side by
+    # side; each result is written as soon as it lands, the summary keeps plan order.
+    results: dict[str, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=len(test_plan)) as pool:
+        futures = {
+            pool.submit(test_fn, codex_path, base_env, cases[case_name]): (case_name, output_name)
+            for case_name, test_fn, output_name in test_plan
+        }
+        for future in as_completed(futures):
+            case_name, output_name = futures[future]
+            results[case_name] = future.result()
+            write_json(OUTPUTS_DIR / output_name, results[case_name])
+    tests = [results[case_name] for case_name, _, _ in test_plan]
 
     conversation_inspection = build_conversation_inspection(tests)
-    write_json(OUTPUTS_DIR / "conversation-inspection.json", conversation_inspection)
+    write_json(CONVERSATION_PATH, conversation_inspection, pretty=True)
 
     all_success = all(test.get("success", False) for test in tests)
+    conversation_file = str(CONVERSATION_PATH)
     summary = {
         "run_started_utc": run_started,
         "run_finished_utc": utc_now(),
-        "workspace_root": str(WORKSPACE_ROOT),
+        "workspace_root": WORKSPACE_DIR,
         "tutorial_dir": str(TUTORIAL_DIR),
         "inputs_file": str(INPUTS_PATH),
         "outputs_dir": str(OUTPUTS_DIR),
@@ -656,17 +889,17 @@ def main() -> int:
         "selected_codex": codex_path,
         "selected_codex_version": read_version(codex_path),
         "codex_home": base_env.get("CODEX_HOME"),
-        "conversation_file": str(OUTPUTS_DIR / "conversation-inspection.json"),
+        "conversation_file": conversation_file,
         "tests": tests,
         "all_success": all_success,
     }
-    write_json(OUTPUTS_DIR / "summary.json", summary)
+    write_json(SUMMARY_PATH, summary, pretty=True)
 
     print(
         json.dumps(
             {
-                "summary_file": str(OUTPUTS_DIR / "summary.json"),
-                "conversation_file": str(OUTPUTS_DIR / "conversation-inspection.json"),
+                "summary_file": str(SUMMARY_PATH),
+                "conversation_file": conversation_file,
                 "all_success": all_success,
             }
         )
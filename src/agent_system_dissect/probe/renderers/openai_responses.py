@@ -5,6 +5,11 @@ Renders request bodies (model/instructions/input/tools) and SSE response
 bodies (event breakdown/output text/reasoning/tool calls/usage) as
 summarized Markdown.  Shared across any target that uses the OpenAI API.
 
+SSE bodies are consumed through
+:func:`~agent_system_dissect.probe.tools.traffic.sse.iter_sse_events`,
+which yields one event at a time; the response renderer aggregates in
+a single pass and never holds the full event list.
+
 Functions
 ---------
 format_request_body : Render an OpenAI Responses API request body.
@@ -13,11 +18,42 @@ format_response_body : Render an OpenAI SSE response body.
 
 from __future__ import annotations
 
+import io
 import json
-from collections import Counter
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
-from agent_system_dissect.probe.tools.traffic.sse import parse_sse_events
+from agent_system_dissect.probe.tools.traffic.sse import iter_sse_events
+
+_NON_SPACE_RE = re.compile(r"\S")
+
+# Request config fields shown next to the model, in display order.
+_CONFIG_KEYS = ("stream", "tool_choice", "parallel_tool_calls", "store")
+_CONFIG_KEYS_SET = frozenset(_CONFIG_KEYS)
+
+# Full-content dumps (long messages, output text, reasoning) are cut here;
+# the summary line still reports the untruncated length.
+_MAX_FULL_CHARS = 200_000
+
+# Dict response bodies up to this compact size are pretty-printed.
+_PRETTY_JSON_MAX_CHARS = 64 * 1024
+
+# Collapsible fenced-code block shared by every body/text section.  The
+# head/tail halves are also written separately around streamed parts.
+_DETAILS_HEAD = (
+    "<details>\n<summary><b>{title}</b> ({count:,} {unit})</summary>"
+    "\n\n```{lang}\n"
+)
+_DETAILS_TAIL = "\n```\n</details>"
+_DETAILS_TMPL = _DETAILS_HEAD + "{body}" + _DETAILS_TAIL
+# Per-message variant used for the full content of long input messages.
+_MESSAGE_DETAILS_TMPL = (
+    "<details>\n<summary>Message {idx} ({role}) full content"
+    " ({count:,} chars)</summary>\n\n```\n{body}\n```\n</details>"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -48,32 +84,29 @@ def format_request_body(body: Any) -> str:
     if body is None:
         return "*(no body)*"
     if isinstance(body, str):
-        return (
-            f"<details>\n<summary><b>Body</b> ({len(body):,} bytes)</summary>"
-            f"\n\n```\n{body}\n```\n</details>"
-        )
+        return _details_bytes("Body", body)
     if not isinstance(body, dict):
         text = str(body)
-        return (
-            f"<details>\n<summary><b>Body</b> ({len(text):,} bytes)</summary>"
-            f"\n\n```\n{text}\n```\n</details>"
-        )
+        return _details_bytes("Body", text)
 
-    lines: list[str] = []
+    out = _MarkdownWriter()
+    w = out.line
+    write = out.write
+    blank = out.blank
 
-    # Model & config fields
+    # Model & config fields, " | "-separated on one line
     model = body.get("model", "unknown")
-    config_parts = [f"**Model:** `{model}`"]
-    for key in ("stream", "tool_choice", "parallel_tool_calls", "store"):
-        if key in body:
-            config_parts.append(f"**{key}:** `{body[key]}`")
+    w(f"**Model:** `{model}`")
+    if not body.keys().isdisjoint(_CONFIG_KEYS_SET):
+        for key in _CONFIG_KEYS:
+            if key in body:
+                write(f" | **{key}:** `{body[key]}`")
     if body.get("reasoning"):
         reasoning = body["reasoning"]
         if isinstance(reasoning, dict):
             summary = reasoning.get("summary", reasoning.get("effort", ""))
-            config_parts.append(f"**reasoning:** `{summary}`")
-    lines.append(" | ".join(config_parts))
-    lines.append("")
+            write(f" | **reasoning:** `{summary}`")
+    blank()
 
     # System instructions
     instructions = body.get("instructions", "")
@@ -82,56 +115,53 @@ def format_request_body(body: Any) -> str:
         preview = instructions[:500]
         if len(instructions) > 500:
             preview += "..."
-        lines.append(
-            f"<details>\n<summary><b>System Instructions</b>"
-            f" ({char_count:,} chars)</summary>\n\n```\n{preview}\n```\n</details>"
-        )
-        lines.append("")
+        w(_details_chars("System Instructions", char_count, preview))
+        blank()
 
     # Input messages
     input_msgs = body.get("input", [])
     if input_msgs:
-        lines.append(f"**Input Messages** ({len(input_msgs)} items):")
-        lines.append("")
-        lines.append("| # | Role | Type | Content Preview |")
-        lines.append("|---|------|------|-----------------|")
+        w(f"**Input Messages** ({len(input_msgs)} items):")
+        blank()
+        w("| # | Role | Type | Content Preview |")
+        w("|---|------|------|-----------------|")
+        # Extract each message's text once; the table preview and the
+        # collapsible full content are both derived from it.
+        extracted: list[tuple[str, str]] = []
+        scratch: list[str] = []
         for idx, msg in enumerate(input_msgs):
             role = msg.get("role", "-")
             msg_type = msg.get("type", "-")
             content = msg.get("content")
-            preview = _message_content_preview(content)
-            lines.append(f"| {idx} | {role} | {msg_type} | {preview} |")
-        lines.append("")
+            full_text = _message_content_text(content, scratch)
+            preview = "*(none)*" if content is None else _text_preview(full_text)
+            w(f"| {idx} | {role} | {msg_type} | {preview} |")
+            extracted.append((role, full_text))
+        blank()
 
         # Collapsible full content for each message
-        for idx, msg in enumerate(input_msgs):
-            content = msg.get("content")
-            full_text = _message_content_full(content)
-            if full_text and len(full_text) > 120:
-                role = msg.get("role", "-")
-                lines.append(
-                    f"<details>\n<summary>Message {idx} ({role}) full content"
-                    f" ({len(full_text):,} chars)</summary>"
-                    f"\n\n```\n{full_text}\n```\n</details>"
-                )
-                lines.append("")
+        for idx, (role, full_text) in enumerate(extracted):
+            if len(full_text) > 120:
+                w(_MESSAGE_DETAILS_TMPL.format(
+                    idx=idx,
+                    role=role,
+                    count=len(full_text),
+                    body=_cap_full_text(full_text),
+                ))
+                blank()
 
     # Tools
     tools = body.get("tools", [])
     if tools:
-        tool_items = []
+        w(f"<details>\n<summary><b>Tools</b> ({len(tools)} defined)</summary>\n")
         for t in tools:
             name = t.get("name") or "(unnamed)"
             ttype = t.get("type", "function")
-            tool_items.append(f"- `{name}` ({ttype})")
-        lines.append(
-            f"<details>\n<summary><b>Tools</b> ({len(tools)} defined)</summary>\n\n"
-            + "\n".join(tool_items)
-            + "\n</details>"
-        )
-        lines.append("")
+            write(f"\n- `{name}` ({ttype})")
+        write("\n</details>")
+        blank()
 
-    return "\n".join(lines)
+    return out.getvalue()
 
 
 # ---------------------------------------------------------------------------
@@ -165,112 +195,90 @@ def format_response_body(body: Any, status_code: int) -> str:  # noqa: ARG001
     if body is None:
         return "*(no body)*"
 
-    # Non-string bodies (dict): render as JSON in <details>
+    # Non-string bodies (dict): render as JSON in <details>.  Large bodies
+    # stay compact; only small ones are worth re-serializing with indentation.
     if isinstance(body, dict):
-        formatted = json.dumps(body, indent=2)
-        return (
-            f"<details>\n<summary><b>Body</b> ({len(formatted):,} bytes)</summary>"
-            f"\n\n```json\n{formatted}\n```\n</details>"
-        )
+        formatted = json.dumps(body, separators=(",", ":"))
+        if len(formatted) <= _PRETTY_JSON_MAX_CHARS:
+            formatted = json.dumps(body, indent=2)
+        return _details_bytes("Body", formatted, lang="json")
 
     if not isinstance(body, str):
         text = str(body)
-        return (
-            f"<details>\n<summary><b>Body</b> ({len(text):,} bytes)</summary>"
-            f"\n\n```\n{text}\n```\n</details>"
-        )
+        return _details_bytes("Body", text)
 
     # Check if this is an SSE stream
-    if not body.lstrip().startswith("event:"):
-        return (
-            f"<details>\n<summary><b>Body</b> ({len(body):,} bytes)</summary>"
-            f"\n\n```\n{body}\n```\n</details>"
-        )
-
-    # Parse SSE events
-    events = parse_sse_events(body)
-    event_type_counts: Counter[str] = Counter(e["event"] for e in events)
-
-    lines: list[str] = []
-    lines.append(f"**SSE Stream** ({len(body):,} bytes, {len(events)} events)")
-    lines.append("")
-
-    # Event type breakdown
-    lines.append("| Event Type | Count |")
-    lines.append("|------------|-------|")
-    for etype, count in event_type_counts.most_common():
-        lines.append(f"| `{etype}` | {count} |")
-    lines.append("")
-
-    # Assemble output text from delta events
-    output_text_parts: list[str] = []
-    reasoning_text_parts: list[str] = []
-    tool_calls: list[dict[str, str]] = []
-    usage = None
-
-    for e in events:
+    if not _looks_like_sse(body):
+        return _details_bytes("Body", body)
+
+    # Single streaming pass: tally event types and dispatch the few
+    # interesting ones to their handlers without buffering the event list.
+    # Events without a handler (the bulk of a typical stream) stop at the
+    # tally; their payload is never touched.
+    parts = _ResponseParts()
+    event_type_counts: dict[str, int] = {}
+    count_of = event_type_counts.get
+    handler_for = _RESPONSE_EVENT_HANDLERS.get
+    event_count = 0
+    for e in iter_sse_events(body):
+        event_count += 1
         etype = e["event"]
-        data = e.get("data")
-        if not isinstance(data, dict):
+        event_type_counts[etype] = count_of(etype, 0) + 1
+        handler = handler_for(etype)
+        if handler is None:
             continue
+        data = e["data"]
+        if isinstance(data, dict):
+            handler(data, parts)
+    usage = parts.usage
+
+    out = _MarkdownWriter()
+    w = out.line
+    write = out.write
+    blank = out.blank
+    w(f"**SSE Stream** ({len(body):,} bytes, {event_count} events)")
+    blank()
 
-        if etype == "response.output_text.delta":
-            output_text_parts.append(data.get("delta", ""))
-        elif etype == "response.reasoning_summary_text.delta":
-            reasoning_text_parts.append(data.get("delta", ""))
-        elif etype == "response.function_call_arguments.done":
-            tool_calls.append({
-                "name": data.get("name", "(unnamed)"),
-                "call_id": data.get("call_id", ""),
-                "arguments": data.get("arguments", ""),
-            })
-        elif etype == "response.completed":
-            resp = data.get("response", {})
-            usage = resp.get("usage")
-
-    # Output text
-    if output_text_parts:
-        output_text = "".join(output_text_parts)
-        lines.append(
-            f"<details>\n<summary><b>Output Text</b>"
-            f" ({len(output_text):,} chars)</summary>"
-            f"\n\n```\n{output_text}\n```\n</details>"
-        )
-        lines.append("")
-
-    # Reasoning summary
-    if reasoning_text_parts:
-        reasoning_text = "".join(reasoning_text_parts)
-        lines.append(
-            f"<details>\n<summary><b>Reasoning Summary</b>"
-            f" ({len(reasoning_text):,} chars)</summary>"
-            f"\n\n```\n{reasoning_text}\n```\n</details>"
-        )
-        lines.append("")
+    # Event type breakdown
+    w("| Event Type | Count |")
+    w("|------------|-------|")
+    # Stable sort keeps first-seen order among equal counts, as most_common() did.
+    for etype, count in sorted(
+        event_type_counts.items(), key=lambda item: item[1], reverse=True
+    ):
+        w(f"| `{etype}` | {count} |")
+    blank()
+
+    # Output text and reasoning summary are written delta by delta, so the
+    # assembled text never exists as one intermediate string.
+    if parts.output_text:
+        _write_details_parts(out, "Output Text", parts.output_text)
+        blank()
+
+    if parts.reasoning_text:
+        _write_details_parts(out, "Reasoning Summary", parts.reasoning_text)
+        blank()
 
     # Tool calls
-    if tool_calls:
-        lines.append(f"**Tool Calls** ({len(tool_calls)}):")
-        lines.append("")
-        for tc in tool_calls:
-            lines.append(f'- `{tc["name"]}` (call_id: `{tc["call_id"]}`)')
-            if tc["arguments"]:
-                args_preview = tc["arguments"][:300]
-                if len(tc["arguments"]) > 300:
+    if parts.tool_names:
+        w(f"**Tool Calls** ({len(parts.tool_names)}):")
+        blank()
+        for name, call_id, arguments in zip(
+            parts.tool_names, parts.tool_call_ids, parts.tool_arguments
+        ):
+            w(f"- `{name}` (call_id: `{call_id}`)")
+            if arguments:
+                args_preview = arguments[:300]
+                if len(arguments) > 300:
                     args_preview += "..."
-                lines.append(f"  ```\n  {args_preview}\n  ```")
-        lines.append("")
+                w(f"  ```\n  {args_preview}\n  ```")
+        blank()
 
     # Usage statistics
     if usage:
         input_tokens = usage.get("input_tokens", 0)
         output_tokens = usage.get("output_tokens", 0)
         total_tokens = usage.get("total_tokens", 0)
-        usage_parts = [
-            f"{input_tokens:,} input",
-            f"{output_tokens:,} output",
-            f"{total_tokens:,} total",
-        ]
         input_details = usage.get("input_tokens_details", {})
         output_details = usage.get("output_tokens_details", {})
         detail_parts = []
@@ -278,13 +286,113 @@ def format_response_body(body: Any, status_code: int) -> str:  # noqa: ARG001
             detail_parts.append(f"{input_details['cached_tokens']:,} cached")
         if output_details.get("reasoning_tokens"):
             detail_parts.append(f"{output_details['reasoning_tokens']:,} reasoning")
-        usage_str = f"**Usage:** {' | '.join(usage_parts)}"
+        w(
+            f"**Usage:** {input_tokens:,} input | {output_tokens:,} output"
+            f" | {total_tokens:,} total"
+        )
         if detail_parts:
-            usage_str += f" ({', '.join(detail_parts)})"
-        lines.append(usage_str)
-        lines.append("")
+            write(f" ({', '.join(detail_parts)})")
+        blank()
+
+    return out.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Markdown output
+# ---------------------------------------------------------------------------
+
+
+class _MarkdownWriter:
+    """
+    Accumulate Markdown lines in a single ``StringIO`` buffer.
+
+    Lines are separated by ``"\\n"`` exactly as ``"\\n".join(lines)``
+    would, so the result has no trailing newline.
+    """
+
+    __slots__ = ("_buf", "_started")
+
+    def __init__(self) -> None:
+        self._buf = io.StringIO()
+        self._started = False
+
+    def line(self, text: str) -> None:
+        """Append one line (which may itself contain newlines)."""
+        if self._started:
+            self._buf.write("\n")
+        else:
+            self._started = True
+        self._buf.write(text)
+
+    def write(self, text: str) -> None:
+        """Append *text* to the current line without a separator."""
+        self._buf.write(text)
+
+    def blank(self) -> None:
+        """Append an empty line."""
+        self.line("")
+
+    def getvalue(self) -> str:
+        """Return the accumulated Markdown text."""
+        return self._buf.getvalue()
+
 
-    return "\n".join(lines)
+# ---------------------------------------------------------------------------
+# SSE event handlers
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _ResponseParts:
+    """
+    Pieces of an SSE response accumulated by the event handlers.
+
+    Tool calls are stored column-wise: the i-th entries of
+    ``tool_names``, ``tool_call_ids`` and ``tool_arguments`` describe
+    the i-th call.
+    """
+
+    output_text: list[str] = field(default_factory=list)
+    reasoning_text: list[str] = field(default_factory=list)
+    tool_names: list[str] = field(default_factory=list)
+    tool_call_ids: list[str] = field(default_factory=list)
+    tool_arguments: list[str] = field(default_factory=list)
+    usage: dict[str, Any] | None = None
+
+
+def _on_output_text_delta(data: dict[str, Any], parts: _ResponseParts) -> None:
+    parts.output_text.append(data.get("delta", ""))
+
+
+def _on_reasoning_summary_delta(data: dict[str, Any], parts: _ResponseParts) -> None:
+    parts.reasoning_text.append(data.get("delta", ""))
+
+
+def _on_function_call_arguments_done(
+    data: dict[str, Any], parts: _ResponseParts
+) -> None:
+    parts.tool_names.append(data.get("name", "(unnamed)"))
+    parts.tool_call_ids.append(data.get("call_id", ""))
+    parts.tool_arguments.append(data.get("arguments", ""))
+
+
+def _on_response_completed(data: dict[str, Any], parts: _ResponseParts) -> None:
+    resp = data.get("response", {})
+    parts.usage = resp.get("usage")
+
+
+_EventHandler = Callable[[dict[str, Any], _ResponseParts], None]
+
+# Keys are interned to match the names yielded by iter_sse_events, so the
+# per-event lookup resolves on identity rather than a string compare.
+_RESPONSE_EVENT_HANDLERS: dict[str, _EventHandler] = {
+    sys.intern("response.output_text.delta"): _on_output_text_delta,
+    sys.intern("response.reasoning_summary_text.delta"): _on_reasoning_summary_delta,
+    sys.intern("response.function_call_arguments.done"): (
+        _on_function_call_arguments_done
+    ),
+    sys.intern("response.completed"): _on_response_completed,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -292,36 +400,91 @@ def format_response_body(body: Any, status_code: int) -> str:  # noqa: ARG001
 # ---------------------------------------------------------------------------
 
 
-def _message_content_preview(content: Any, max_len: int = 80) -> str:
-    """Return a short single-line text preview from message content."""
-    if content is None:
-        return "*(none)*"
-    if isinstance(content, str):
-        text = content
-    elif isinstance(content, list):
-        texts = []
-        for item in content:
-            if isinstance(item, dict):
-                texts.append(item.get("text", ""))
-        text = " ".join(texts)
-    else:
-        text = str(content)
-    text = text.replace("\n", " ").strip()
-    if len(text) > max_len:
-        return text[:max_len] + "..."
-    return text if text else "*(empty)*"
-
-
-def _message_content_full(content: Any) -> str:
-    """Return the full text extracted from message content."""
+def _details_bytes(title: str, body: str, lang: str = "") -> str:
+    """Render *body* in a collapsible block whose summary shows its size."""
+    return _DETAILS_TMPL.format(
+        title=title, count=len(body), unit="bytes", lang=lang, body=body
+    )
+
+
+def _details_chars(title: str, char_count: int, body: str) -> str:
+    """Render *body* in a collapsible block labelled with *char_count* chars."""
+    return _DETAILS_TMPL.format(
+        title=title, count=char_count, unit="chars", lang="", body=body
+    )
+
+
+def _write_details_parts(out: _MarkdownWriter, title: str, parts: list[str]) -> None:
+    """
+    Write *parts* as one collapsible block, capped like ``_cap_full_text``.
+
+    Produces the same Markdown as ``_details_chars`` over the capped
+    ``"".join(parts)`` without materialising the joined string.
+    """
+    total = sum(map(len, parts))
+    out.line(_DETAILS_HEAD.format(title=title, count=total, unit="chars", lang=""))
+    write = out.write
+    remaining = _MAX_FULL_CHARS
+    for part in parts:
+        if len(part) >= remaining:
+            write(part[:remaining])
+            break
+        write(part)
+        remaining -= len(part)
+    if total > _MAX_FULL_CHARS:
+        write(f"\n... [truncated, {total - _MAX_FULL_CHARS:,} more chars]")
+    write(_DETAILS_TAIL)
+
+
+def _cap_full_text(text: str) -> str:
+    """Cut *text* to ``_MAX_FULL_CHARS`` with a note of how much was dropped."""
+    if len(text) <= _MAX_FULL_CHARS:
+        return text
+    dropped = len(text) - _MAX_FULL_CHARS
+    return f"{text[:_MAX_FULL_CHARS]}\n... [truncated, {dropped:,} more chars]"
+
+
+def _message_content_text(content: Any, scratch: list[str]) -> str:
+    """
+    Return the full text extracted from message content.
+
+    *scratch* is a caller-owned list reused across messages to collect
+    the text parts of list content; it is cleared before use.
+    """
     if content is None:
         return ""
     if isinstance(content, str):
         return content
     if isinstance(content, list):
-        texts = []
+        scratch.clear()
+        append = scratch.append
         for item in content:
             if isinstance(item, dict):
-                texts.append(item.get("text", ""))
-        return "\n".join(texts)
+                append(item.get("text", ""))
+        return "\n".join(scratch)
     return str(content)
+
+
+def _looks_like_sse(body: str) -> bool:
+    """Return whether *body* starts with ``event:`` after leading whitespace."""
+    first = _NON_SPACE_RE.search(body)
+    return first is not None and body.startswith("event:", first.start())
+
+
+def _text_preview(text: str, max_len: int = 80) -> str:
+    """
+    Return a short single-line preview of extracted message text.
+
+    Equivalent to stripping the whole text, flattening newlines and
+    truncating to *max_len*, but only the leading whitespace and a
+    *max_len* window are ever scanned or copied, so huge pasted content
+    costs no more than a short message.
+    """
+    first = _NON_SPACE_RE.search(text)
+    if first is None:
+        return "*(empty)*"
+    start = first.start()
+    head = text[start : start + max_len].replace("\n", " ")
+    if _NON_SPACE_RE.search(text, start + max_len) is not None:
+        return head + "..."
+    return head.rstrip()
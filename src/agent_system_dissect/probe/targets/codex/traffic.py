@@ -45,5 +45,7 @@ analysis_profile = AnalysisProfile(
     report_title="Codex Traffic Analysis Report",
     request_body_renderer=format_request_body,
     response_body_renderer=format_response_body,
-    redacted_headers={"authorization", "cookie", "set-cookie", "openai-organization"},
+    redacted_headers=frozenset(
+        {"authorization", "cookie", "set-cookie", "openai-organization"}
+    ),
 )
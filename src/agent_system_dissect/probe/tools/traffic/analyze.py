@@ -8,13 +8,18 @@ renderer callables.
 
 Functions
 ---------
+iter_entries : Lazily yield parsed dicts from a JSONL file.
 load_entries : Parse a JSONL file into a list of dicts.
 type_name : Return a human-readable type label for a value.
-extract_keys : Recursively extract dotted key paths with types.
+extract_keys : Yield dotted key paths with types, depth first.
 analyze : Compute aggregate statistics from traffic entries.
+analyze_file : Compute statistics for a JSONL file, optionally in parallel.
+resolve_blobs : Load blob-referenced bodies from their side files.
 redact_headers : Replace sensitive header values with ``[REDACTED]``.
+iter_conversation_lines : Lazily yield the conversation log lines.
 format_conversations : Render the full conversation log section.
 format_report : Assemble the complete Markdown report.
+write_report : Stream the complete Markdown report to a file.
 load_analysis_profile : Import an AnalysisProfile by target name.
 main : CLI entry point.
 
@@ -31,23 +36,70 @@ Examples
 from __future__ import annotations
 
 import argparse
+import functools
+import heapq
 import importlib
+import itertools
 import json
+import mmap
 import os
 import sys
-from collections import Counter, defaultdict
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from operator import itemgetter
+from typing import Any, TextIO
 from urllib.parse import urlparse
 
 from agent_system_dissect.probe.tools.traffic.types import AnalysisProfile
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 
 # ---------------------------------------------------------------------------
 # JSONL loading
 # ---------------------------------------------------------------------------
 
 
+def iter_entries(path: str, *, warn: bool = True) -> Iterator[dict]:
+    """
+    Lazily yield traffic entries from a JSONL file.
+
+    Lines are parsed one at a time as the file is read, so callers that
+    aggregate over a capture never hold more than one entry.
+
+    Parameters
+    ----------
+    path : str
+        Filesystem path to the ``.jsonl`` file.
+    warn : bool, optional
+        Print a warning to stderr for each skipped malformed line.
+        Disable for repeat passes over a file already reported on.
+
+    Yields
+    ------
+    dict
+        Parsed JSON objects, one per non-empty line.  Malformed lines
+        are skipped.
+
+    Notes
+    -----
+    The file is read in binary mode and each line is parsed from bytes
+    with ``orjson`` when it is installed.  Lines ``orjson`` rejects (for
+    example ``NaN``/``Infinity`` literals) are retried with the standard
+    library parser, so the set of accepted lines is unchanged.  Lines
+    with a run of 19 or more digits go straight to the standard parser,
+    because ``orjson`` would turn integers beyond 64 bits into floats.
+    """
+    with open(path, "rb") as f:
+        yield from _parse_lines(enumerate(f, 1), warn)
+
+
 def load_entries(path: str) -> list[dict]:
     """
     Load traffic entries from a JSONL file.
@@ -60,26 +112,78 @@ def load_entries(path: str) -> list[dict]:
     Returns
     -------
     list of dict
-        Parsed JSON objects, one per non-empty line.  Malformed lines
-        are skipped with a warning to stderr.
-    """
-    entries: list[dict] = []
-    with open(path) as f:
-        for i, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError as e:
+        Parsed JSON objects, one per non-empty line, as produced by
+        :func:`iter_entries`.  Malformed lines are skipped with a
+        warning to stderr.
+    """
+    return list(iter_entries(path))
+
+
+def _parse_lines(
+    numbered_lines: Iterable[tuple[int, bytes]], warn: bool
+) -> Iterator[dict]:
+    """
+    Parse ``(line_number, raw_line)`` pairs, skipping blank/bad lines.
+
+    Lines that are valid JSON but not an object (e.g. a stray ``null``)
+    are skipped with a warning too, so every yielded entry supports the
+    ``entry.get(...)`` access the analyzers rely on.
+    """
+    for i, line in numbered_lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = _json_loads(line)
+        except json.JSONDecodeError as e:
+            if warn:
                 print(f"WARNING: skipping malformed line {i}: {e}", file=sys.stderr)
-    return entries
+            continue
+        if type(entry) is not dict:
+            if warn:
+                print(
+                    f"WARNING: skipping line {i}: expected a JSON object,"
+                    f" got {type_name(entry)}",
+                    file=sys.stderr,
+                )
+            continue
+        yield entry
+
+
+# orjson turns integers beyond 64 bits into floats, so documents that may
+# hold one -- any run of 19+ digits -- are left to ``json``, which keeps
+# them exact.  The run is found by mapping digits to "0" and everything
+# else to " " (a C-speed translate; a regex scan costs more than json
+# itself); digit runs inside strings only cost the slower parse.
+_DIGIT_MASK = bytes(0x30 if 0x30 <= b <= 0x39 else 0x20 for b in range(256))
+_WIDE_INT_RUN = b"0" * 19
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse one JSON document, preferring ``orjson`` when it is exact."""
+    if orjson is not None and _WIDE_INT_RUN not in data.translate(_DIGIT_MASK):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
 # ---------------------------------------------------------------------------
 # Payload structure helpers
 # ---------------------------------------------------------------------------
 
+# Exact JSON value types to labels, in isinstance precedence order.
+_TYPE_LABELS: dict[type, str] = {
+    type(None): "null",
+    bool: "bool",
+    int: "int",
+    float: "float",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
+
 
 def type_name(v: Any) -> str:
     """
@@ -96,48 +200,61 @@ def type_name(v: Any) -> str:
         One of ``"null"``, ``"bool"``, ``"int"``, ``"float"``,
         ``"string"``, ``"array"``, ``"object"``, or the Python type name.
     """
-    if v is None:
-        return "null"
-    if isinstance(v, bool):
-        return "bool"
-    if isinstance(v, int):
-        return "int"
-    if isinstance(v, float):
-        return "float"
-    if isinstance(v, str):
-        return "string"
-    if isinstance(v, list):
-        return "array"
-    if isinstance(v, dict):
-        return "object"
+    label = _TYPE_LABELS.get(type(v))
+    if label is not None:
+        return label
+    # Subclasses (e.g. OrderedDict, IntEnum) miss the exact-type lookup;
+    # classify them the same way isinstance would, bool before int.
+    for cls, label in _TYPE_LABELS.items():
+        if isinstance(v, cls):
+            return label
     return type(v).__name__
 
 
-def extract_keys(obj: Any, prefix: str = "") -> list[tuple[str, str]]:
+def extract_keys(obj: Any, prefix: str = "") -> Iterator[tuple[str, str]]:
     """
-    Recursively extract dotted key paths with data types.
+    Extract dotted key paths with data types, depth first.
+
+    Walks nested objects with an explicit stack of item iterators rather
+    than recursion, yielding in the same pre-order a recursive walk
+    would: each key comes before the keys nested under it.  Lists
+    contribute the structure of their first element under a ``[]``
+    suffix.
 
     Parameters
     ----------
     obj : Any
         A parsed JSON value (dict, list, or scalar).
     prefix : str, optional
-        Dotted path prefix accumulated during recursion.
+        Dotted path prefix prepended to every yielded key path.
 
-    Returns
-    -------
-    list of (str, str)
+    Yields
+    ------
+    (str, str)
         Tuples of ``(dotted_key_path, type_label)``.
     """
-    keys: list[tuple[str, str]] = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            full = f"{prefix}.{k}" if prefix else k
-            keys.append((full, type_name(v)))
-            keys.extend(extract_keys(v, full))
-    elif isinstance(obj, list) and obj:
-        keys.extend(extract_keys(obj[0], f"{prefix}[]"))
-    return keys
+    stack: list[tuple[Iterator[tuple[Any, Any]], str]] = []
+    while True:
+        # Descend into the value just visited (or the root).
+        while isinstance(obj, list) and obj:
+            obj = obj[0]
+            prefix = f"{prefix}[]"
+        if isinstance(obj, dict):
+            stack.append((iter(obj.items()), prefix))
+
+        # Advance to the next key, unwinding exhausted objects.
+        while stack:
+            item = next(stack[-1][0], None)
+            if item is not None:
+                break
+            stack.pop()
+        else:
+            return
+
+        k, obj = item
+        parent = stack[-1][1]
+        prefix = f"{parent}.{k}" if parent else k
+        yield prefix, type_name(obj)
 
 
 # ---------------------------------------------------------------------------
@@ -145,39 +262,111 @@ def extract_keys(obj: Any, prefix: str = "") -> list[tuple[str, str]]:
 # ---------------------------------------------------------------------------
 
 
-def analyze(entries: list[dict]) -> dict:
+# Rows kept in the endpoint table; captures with many distinct URL paths
+# only pay for a bounded heap selection instead of a full sort.
+_TOP_ENDPOINTS = 100
+
+
+def analyze(entries: Iterable[dict]) -> dict:
     """
     Compute aggregate statistics from traffic entries.
 
     Parameters
     ----------
-    entries : list of dict
+    entries : iterable of dict
         Parsed JSONL entries, each containing ``request`` and ``response``
-        sub-dicts.
+        sub-dicts.  Consumed in a single pass, so a lazy
+        :func:`iter_entries` stream works without buffering.
 
     Returns
     -------
     dict
         Keys include ``total_requests``, ``duration_seconds``,
-        ``endpoint_counts``, ``method_counts``, ``status_counts``,
+        ``endpoint_counts`` (the top ``_TOP_ENDPOINTS``),
+        ``distinct_endpoints``, ``method_counts``, ``status_counts``,
         ``endpoint_methods``, ``request_key_counts``,
         ``response_key_counts``, ``request_key_types``,
         ``response_key_types``, ``total_req_bytes``,
         ``total_resp_bytes``.
     """
-    endpoint_counts: Counter[str] = Counter()
-    method_counts: Counter[str] = Counter()
-    status_counts: Counter[str] = Counter()
-    request_key_counts: Counter[str] = Counter()
-    response_key_counts: Counter[str] = Counter()
-    request_key_types: dict[str, set[str]] = defaultdict(set)
-    response_key_types: dict[str, set[str]] = defaultdict(set)
-    endpoint_methods: dict[str, set[str]] = defaultdict(set)
-    timestamps: list[float] = []
-    total_req_bytes = 0
-    total_resp_bytes = 0
-
+    tally = _Tally()
+    add = tally.add
     for entry in entries:
+        add(entry)
+    return tally.result()
+
+
+def analyze_file(path: str, processes: int = 1, chunk_lines: int = 2000) -> dict:
+    """
+    Compute aggregate statistics for a JSONL capture, optionally in parallel.
+
+    With ``processes > 1`` the file is cut into chunks of *chunk_lines*
+    raw lines which worker processes parse and tally independently; the
+    partial tallies are merged in file order, so the result (including
+    the tie order of ranked counts) equals :func:`analyze` over
+    :func:`iter_entries`.  At most ``2 * processes`` chunks are in flight
+    at a time, keeping memory bounded on large captures.
+
+    Parameters
+    ----------
+    path : str
+        Filesystem path to the ``.jsonl`` file.
+    processes : int, optional
+        Number of worker processes.  ``1`` (the default) analyzes in the
+        calling process.
+    chunk_lines : int, optional
+        Raw lines per work unit sent to a worker.
+
+    Returns
+    -------
+    dict
+        Same structure as :func:`analyze`.
+    """
+    if processes <= 1:
+        return analyze(iter_entries(path))
+
+    tally = _Tally()
+    pending: deque[Future[_Tally]] = deque()
+    with ProcessPoolExecutor(processes) as pool:
+        for chunk in _line_chunks(path, chunk_lines):
+            pending.append(pool.submit(_tally_chunk, chunk))
+            if len(pending) >= 2 * processes:
+                tally.merge(pending.popleft().result())
+        while pending:
+            tally.merge(pending.popleft().result())
+    return tally.result()
+
+
+class _Tally:
+    """
+    Mergeable running totals behind :func:`analyze`.
+
+    Counts live in plain dicts.  The types seen per key path are kept as
+    bitmasks over ``type_bits`` and only expanded to label sets by
+    :meth:`result`.
+    """
+
+    def __init__(self) -> None:
+        self.total_requests = 0
+        self.endpoint_counts: dict[str, int] = {}
+        self.method_counts: dict[str, int] = {}
+        self.status_counts: dict[str, int] = {}
+        self.endpoint_methods: dict[str, set[str]] = defaultdict(set)
+        self.request_key_counts: dict[str, int] = {}
+        self.response_key_counts: dict[str, int] = {}
+        self.type_bits: dict[str, int] = {}
+        self.request_key_types: dict[str, int] = {}
+        self.response_key_types: dict[str, int] = {}
+        # Only the extremes of the timestamps are needed for the duration.
+        self.ts_count = 0
+        self.ts_min: float = 0.0
+        self.ts_max: float = 0.0
+        self.total_req_bytes = 0
+        self.total_resp_bytes = 0
+
+    def add(self, entry: dict) -> None:
+        """Fold one traffic entry into the totals."""
+        self.total_requests += 1
         req = entry.get("request", {})
         resp = entry.get("response", {})
         url = req.get("url", "")
@@ -185,58 +374,248 @@ def analyze(entries: list[dict]) -> dict:
         status = resp.get("status_code")
         ts = entry.get("timestamp")
 
-        parsed = urlparse(url)
-        endpoint = parsed.path or "/"
-        endpoint_counts[endpoint] += 1
-        method_counts[method] += 1
-        endpoint_methods[endpoint].add(method)
+        endpoint = _endpoint(url)
+        endpoint_counts = self.endpoint_counts
+        endpoint_counts[endpoint] = endpoint_counts.get(endpoint, 0) + 1
+        method_counts = self.method_counts
+        method_counts[method] = method_counts.get(method, 0) + 1
+        self.endpoint_methods[endpoint].add(method)
         if status is not None:
-            status_counts[str(status)] += 1
+            status_key = str(status)
+            status_counts = self.status_counts
+            status_counts[status_key] = status_counts.get(status_key, 0) + 1
         if ts:
-            timestamps.append(ts)
+            if self.ts_count:
+                if ts < self.ts_min:
+                    self.ts_min = ts
+                elif ts > self.ts_max:
+                    self.ts_max = ts
+            else:
+                self.ts_min = self.ts_max = ts
+            self.ts_count += 1
 
         req_body = req.get("body")
-        if isinstance(req_body, dict):
-            for key, dtype in extract_keys(req_body):
-                request_key_counts[key] += 1
-                request_key_types[key].add(dtype)
-        if isinstance(req_body, (str, bytes)):
-            total_req_bytes += (
-                len(req_body) if isinstance(req_body, bytes) else len(req_body.encode())
-            )
-        elif req_body is not None:
-            total_req_bytes += len(json.dumps(req_body))
+        if isinstance(req_body, dict) and not _is_blob_ref(req_body):
+            self._tally_keys(req_body, self.request_key_counts, self.request_key_types)
+        self.total_req_bytes += _payload_size(req_body)
 
         resp_body = resp.get("body")
-        if isinstance(resp_body, dict):
-            for key, dtype in extract_keys(resp_body):
-                response_key_counts[key] += 1
-                response_key_types[key].add(dtype)
-        if isinstance(resp_body, (str, bytes)):
-            total_resp_bytes += (
-                len(resp_body)
-                if isinstance(resp_body, bytes)
-                else len(resp_body.encode())
+        if isinstance(resp_body, dict) and not _is_blob_ref(resp_body):
+            self._tally_keys(
+                resp_body, self.response_key_counts, self.response_key_types
             )
-        elif resp_body is not None:
-            total_resp_bytes += len(json.dumps(resp_body))
+        self.total_resp_bytes += _payload_size(resp_body)
+
+    def merge(self, other: _Tally) -> None:
+        """Fold the totals of *other*, which covers later entries, into self."""
+        self.total_requests += other.total_requests
+        for mine, theirs in (
+            (self.endpoint_counts, other.endpoint_counts),
+            (self.method_counts, other.method_counts),
+            (self.status_counts, other.status_counts),
+            (self.request_key_counts, other.request_key_counts),
+            (self.response_key_counts, other.response_key_counts),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        for endpoint, methods in other.endpoint_methods.items():
+            self.endpoint_methods[endpoint] |= methods
+
+        # Re-express the other tally's type masks in this tally's bits.
+        remap = {bit: self._type_bit(label) for label, bit in other.type_bits.items()}
+        for mine_types, theirs_types in (
+            (self.request_key_types, other.request_key_types),
+            (self.response_key_types, other.response_key_types),
+        ):
+            for key, mask in theirs_types.items():
+                translated = 0
+                for bit, my_bit in remap.items():
+                    if mask & bit:
+                        translated |= my_bit
+                mine_types[key] = mine_types.get(key, 0) | translated
+
+        if other.ts_count:
+            if self.ts_count:
+                self.ts_min = min(self.ts_min, other.ts_min)
+                self.ts_max = max(self.ts_max, other.ts_max)
+            else:
+                self.ts_min, self.ts_max = other.ts_min, other.ts_max
+            self.ts_count += other.ts_count
+        self.total_req_bytes += other.total_req_bytes
+        self.total_resp_bytes += other.total_resp_bytes
+
+    def result(self) -> dict:
+        """Return the statistics dict documented by :func:`analyze`."""
+        duration = self.ts_max - self.ts_min if self.ts_count >= 2 else 0
+        return {
+            "total_requests": self.total_requests,
+            "duration_seconds": round(duration, 1),
+            "endpoint_counts": _most_common(self.endpoint_counts, _TOP_ENDPOINTS),
+            "distinct_endpoints": len(self.endpoint_counts),
+            "method_counts": _most_common(self.method_counts),
+            "status_counts": _most_common(self.status_counts),
+            "endpoint_methods": {
+                k: sorted(v) for k, v in self.endpoint_methods.items()
+            },
+            "request_key_counts": _most_common(self.request_key_counts, 30),
+            "response_key_counts": _most_common(self.response_key_counts, 30),
+            "request_key_types": self._decode_type_masks(self.request_key_types),
+            "response_key_types": self._decode_type_masks(self.response_key_types),
+            "total_req_bytes": self.total_req_bytes,
+            "total_resp_bytes": self.total_resp_bytes,
+        }
+
+    def _type_bit(self, label: str) -> int:
+        """Return the bit for *label*, claiming the next free one if new."""
+        bit = self.type_bits.get(label)
+        if bit is None:
+            bit = self.type_bits[label] = 1 << len(self.type_bits)
+        return bit
+
+    def _tally_keys(
+        self, body: dict, counts: dict[str, int], types: dict[str, int]
+    ) -> None:
+        """Count *body*'s key paths and OR their type bits into *types*."""
+        type_bits = self.type_bits
+        for key, dtype in extract_keys(body):
+            counts[key] = counts.get(key, 0) + 1
+            bit = type_bits.get(dtype)
+            if bit is None:
+                bit = self._type_bit(dtype)
+            types[key] = types.get(key, 0) | bit
+
+    def _decode_type_masks(self, masks: dict[str, int]) -> dict[str, set[str]]:
+        """Expand per-key type bitmasks back into sets of type labels."""
+        type_bits = self.type_bits
+        return {
+            key: {label for label, bit in type_bits.items() if mask & bit}
+            for key, mask in masks.items()
+        }
+
+
+@functools.lru_cache(maxsize=4096)
+def _endpoint(url: str) -> str:
+    """Return the path of *url* (``"/"`` if empty); cached per distinct URL."""
+    return urlparse(url).path or "/"
+
+
+def _line_chunks(path: str, chunk_lines: int) -> Iterator[tuple[int, list[bytes]]]:
+    """Yield ``(first_line_number, raw_lines)`` slices of a file."""
+    with open(path, "rb") as f:
+        first = 1
+        while True:
+            lines = list(itertools.islice(f, chunk_lines))
+            if not lines:
+                return
+            yield first, lines
+            first += len(lines)
+
+
+def _tally_chunk(chunk: tuple[int, list[bytes]]) -> _Tally:
+    """Parse and tally one chunk of raw JSONL lines (worker entry point)."""
+    first, lines = chunk
+    tally = _Tally()
+    for entry in _parse_lines(enumerate(lines, first), warn=True):
+        tally.add(entry)
+    return tally
+
+
+def _most_common(
+    counts: dict[str, int], n: int | None = None
+) -> list[tuple[str, int]]:
+    """Return ``(key, count)`` pairs by descending count, like ``most_common``."""
+    if n is None:
+        return sorted(counts.items(), key=itemgetter(1), reverse=True)
+    return heapq.nlargest(n, counts.items(), key=itemgetter(1))
+
+
+def _payload_size(body: Any) -> int:
+    """
+    Return the payload size of a captured body in bytes.
 
-    duration = max(timestamps) - min(timestamps) if len(timestamps) >= 2 else 0
+    Strings count their UTF-8 length (ASCII strings, the common case,
+    without encoding a copy), bytes their length, blob references their
+    recorded length, and other non-null values the length of their
+    ``json.dumps`` text.
+    """
+    if isinstance(body, str):
+        return len(body) if body.isascii() else len(body.encode())
+    if isinstance(body, bytes):
+        return len(body)
+    if body is None:
+        return 0
+    if isinstance(body, dict) and _is_blob_ref(body):
+        return int(body["len"])
+    return len(json.dumps(body))
+
+
+# ---------------------------------------------------------------------------
+# Body blobs
+# ---------------------------------------------------------------------------
+
+
+def resolve_blobs(entries: Iterable[dict], base_dir: str) -> Iterator[dict]:
+    """
+    Replace blob-reference bodies with the referenced file contents.
+
+    Captures made with SSE blobs enabled store SSE response bodies as
+    ``{"__ref__": "sse/<id>.sse", "len": <bytes>}``.  This generator
+    loads each referenced file (memory-mapped and decoded as UTF-8) just
+    before its entry is yielded, so only one body is held at a time.
+    Inline bodies pass through untouched; references whose file cannot
+    be read (missing, a directory, unreadable), or whose path leaves
+    *base_dir*, are left as is with a warning on stderr.
+
+    Parameters
+    ----------
+    entries : iterable of dict
+        Parsed JSONL traffic entries.
+    base_dir : str
+        Directory containing the capture's ``traffic.jsonl``.
+
+    Yields
+    ------
+    dict
+        The entries, with resolvable blob references replaced in place.
+    """
+    for entry in entries:
+        for side in ("request", "response"):
+            part = entry.get(side)
+            if isinstance(part, dict):
+                body = part.get("body")
+                if isinstance(body, dict) and _is_blob_ref(body):
+                    text = _load_blob(base_dir, body["__ref__"])
+                    if text is not None:
+                        part["body"] = text
+        yield entry
+
+
+def _is_blob_ref(body: dict) -> bool:
+    """Return whether *body* is a ``{"__ref__", "len"}`` blob reference."""
+    return body.keys() == _BLOB_REF_KEYS and isinstance(body["__ref__"], str)
 
-    return {
-        "total_requests": len(entries),
-        "duration_seconds": round(duration, 1),
-        "endpoint_counts": endpoint_counts.most_common(),
-        "method_counts": method_counts.most_common(),
-        "status_counts": status_counts.most_common(),
-        "endpoint_methods": {k: sorted(v) for k, v in endpoint_methods.items()},
-        "request_key_counts": request_key_counts.most_common(30),
-        "response_key_counts": response_key_counts.most_common(30),
-        "request_key_types": request_key_types,
-        "response_key_types": response_key_types,
-        "total_req_bytes": total_req_bytes,
-        "total_resp_bytes": total_resp_bytes,
-    }
+
+_BLOB_REF_KEYS = {"__ref__", "len"}
+
+
+def _load_blob(base_dir: str, ref: str) -> str | None:
+    """Read a referenced blob as text, or ``None`` (with a warning) if unusable."""
+    if os.path.isabs(ref) or ".." in ref.split("/"):
+        print(
+            f"WARNING: skipping blob {ref}: path leaves the capture directory",
+            file=sys.stderr,
+        )
+        return None
+    try:
+        with open(os.path.join(base_dir, ref), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return str(m, "utf-8", "replace")
+    except (OSError, ValueError) as e:
+        # ValueError: mmap of a file truncated to zero after the size check
+        print(f"WARNING: skipping blob {ref}: {e}", file=sys.stderr)
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -244,7 +623,9 @@ def analyze(entries: list[dict]) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def redact_headers(headers: dict[str, str], redacted: set[str]) -> dict[str, str]:
+def redact_headers(
+    headers: dict[str, str], redacted: AbstractSet[str]
+) -> dict[str, str]:
     """
     Replace sensitive header values with a redaction marker.
 
@@ -252,7 +633,7 @@ def redact_headers(headers: dict[str, str], redacted: set[str]) -> dict[str, str
     ----------
     headers : dict of str to str
         Raw HTTP headers.
-    redacted : set of str
+    redacted : set or frozenset of str
         Lowercase header names to redact.
 
     Returns
@@ -262,43 +643,83 @@ def redact_headers(headers: dict[str, str], redacted: set[str]) -> dict[str, str
         ``"[REDACTED]"`` (or a truncated prefix followed by
         ``"...[REDACTED]"``).
     """
-    result: dict[str, str] = {}
-    for k, v in headers.items():
-        if k.lower() in redacted:
-            result[k] = v[:20] + "...[REDACTED]" if len(v) > 20 else "[REDACTED]"
-        else:
-            result[k] = v
-    return result
+    return {
+        k: _redacted_value(v) if k.lower() in redacted else v
+        for k, v in headers.items()
+    }
+
+
+def _redacted_value(v: str) -> str:
+    """Return the redaction marker for a sensitive header value."""
+    return v[:20] + "...[REDACTED]" if len(v) > 20 else "[REDACTED]"
 
 
 # ---------------------------------------------------------------------------
 # Report generation
 # ---------------------------------------------------------------------------
 
-
-def format_conversations(entries: list[dict], profile: AnalysisProfile) -> str:
+# One request/response pair of the conversation log.  Header blocks are
+# pre-rendered with a trailing newline per header.
+_CONVERSATION_ENTRY_TMPL = (
+    "### Request {index}: `{method} {url}` → {status}\n"
+    "**Time:** {time} UTC\n"
+    "\n"
+    "<details>\n"
+    "<summary><b>Request Headers</b></summary>\n"
+    "\n"
+    "```\n"
+    "{request_headers}"
+    "```\n"
+    "</details>\n"
+    "\n"
+    "#### Request Body\n"
+    "\n"
+    "{request_body}\n"
+    "\n"
+    "<details>\n"
+    "<summary><b>Response Headers</b></summary>\n"
+    "\n"
+    "```\n"
+    "{response_headers}"
+    "```\n"
+    "</details>\n"
+    "\n"
+    "#### Response Body\n"
+    "\n"
+    "{response_body}\n"
+    "\n"
+    "---\n"
+)
+
+
+def iter_conversation_lines(
+    entries: Iterable[dict], profile: AnalysisProfile
+) -> Iterator[str]:
     """
-    Format the full conversation log section of the report.
+    Yield the lines of the full conversation log section.
 
     Each request/response pair is rendered with redacted headers and
-    body content produced by the profile's pluggable renderers.
+    body content produced by the profile's pluggable renderers.  Entries
+    are rendered as they are consumed, so a lazy entry stream is never
+    buffered.
 
     Parameters
     ----------
-    entries : list of dict
+    entries : iterable of dict
         Parsed JSONL traffic entries.
     profile : AnalysisProfile
         Provides body renderers and header redaction rules.
 
-    Returns
-    -------
+    Yields
+    ------
     str
-        Markdown text for the conversation log section.
+        The section heading lines, then one multi-line chunk per entry;
+        joined with ``"\\n"`` they form the section text.
     """
-    lines: list[str] = []
-    lines.append("## Full Conversation Log")
-    lines.append("")
+    yield "## Full Conversation Log"
+    yield ""
 
+    redacted = profile.redacted_headers
     for i, entry in enumerate(entries, 1):
         req = entry.get("request", {})
         resp = entry.get("response", {})
@@ -308,59 +729,59 @@ def format_conversations(entries: list[dict], profile: AnalysisProfile) -> str:
             if ts
             else "?"
         )
-
-        method = req.get("method", "?")
-        url = req.get("url", "?")
         status = resp.get("status_code", "?")
-        headers = req.get("headers", {})
-        resp_headers = resp.get("headers", {})
 
-        lines.append(f"### Request {i}: `{method} {url}` → {status}")
-        lines.append(f"**Time:** {ts_str} UTC")
-        lines.append("")
+        # One template fill per entry; bodies are delegated to the profile
+        # renderers and headers are redacted.
+        yield _CONVERSATION_ENTRY_TMPL.format(
+            index=i,
+            method=req.get("method", "?"),
+            url=req.get("url", "?"),
+            status=status,
+            time=ts_str,
+            request_headers=_header_block(req.get("headers", {}), redacted),
+            request_body=profile.request_body_renderer(req.get("body")),
+            response_headers=_header_block(resp.get("headers", {}), redacted),
+            response_body=profile.response_body_renderer(resp.get("body"), status),
+        )
 
-        # Request headers (redacted)
-        lines.append("<details>")
-        lines.append("<summary><b>Request Headers</b></summary>")
-        lines.append("")
-        lines.append("```")
-        for k, v in redact_headers(headers, profile.redacted_headers).items():
-            lines.append(f"{k}: {v}")
-        lines.append("```")
-        lines.append("</details>")
-        lines.append("")
 
-        # Request body — delegated to profile renderer
-        lines.append("#### Request Body")
-        lines.append("")
-        lines.append(profile.request_body_renderer(req.get("body")))
-        lines.append("")
+def _header_block(headers: dict[str, str], redacted: AbstractSet[str]) -> str:
+    """
+    Render headers as ``"name: value"`` lines, each newline-ended.
 
-        # Response headers
-        lines.append("<details>")
-        lines.append("<summary><b>Response Headers</b></summary>")
-        lines.append("")
-        lines.append("```")
-        for k, v in redact_headers(resp_headers, profile.redacted_headers).items():
-            lines.append(f"{k}: {v}")
-        lines.append("```")
-        lines.append("</details>")
-        lines.append("")
+    Applies the same redaction as :func:`redact_headers` while
+    formatting, without building the intermediate redacted dict.
+    """
+    return "".join([
+        f"{k}: {_redacted_value(v) if k.lower() in redacted else v}\n"
+        for k, v in headers.items()
+    ])
 
-        # Response body — delegated to profile renderer
-        lines.append("#### Response Body")
-        lines.append("")
-        lines.append(profile.response_body_renderer(resp.get("body"), status))
-        lines.append("")
-        lines.append("---")
-        lines.append("")
 
-    return "\n".join(lines)
+def format_conversations(entries: Iterable[dict], profile: AnalysisProfile) -> str:
+    """
+    Format the full conversation log section of the report.
+
+    Parameters
+    ----------
+    entries : iterable of dict
+        Parsed JSONL traffic entries.
+    profile : AnalysisProfile
+        Provides body renderers and header redaction rules.
+
+    Returns
+    -------
+    str
+        Markdown text for the conversation log section, as yielded by
+        :func:`iter_conversation_lines`.
+    """
+    return "\n".join(iter_conversation_lines(entries, profile))
 
 
 def format_report(
     analysis_data: dict,
-    entries: list[dict],
+    entries: Iterable[dict],
     input_path: str,
     profile: AnalysisProfile,
 ) -> str:
@@ -371,7 +792,7 @@ def format_report(
     ----------
     analysis_data : dict
         Output of :func:`analyze`.
-    entries : list of dict
+    entries : iterable of dict
         Parsed JSONL traffic entries.
     input_path : str
         Path to the source JSONL file (shown in the report header).
@@ -383,6 +804,51 @@ def format_report(
     str
         The full Markdown report text.
     """
+    return (
+        _format_summary(analysis_data, input_path, profile)
+        + "\n"
+        + format_conversations(entries, profile)
+    )
+
+
+def write_report(
+    f: TextIO,
+    analysis_data: dict,
+    entries: Iterable[dict],
+    input_path: str,
+    profile: AnalysisProfile,
+) -> None:
+    """
+    Stream the complete Markdown analysis report to a text file.
+
+    Writes exactly the text :func:`format_report` returns, but the
+    conversation log is written entry by entry instead of being
+    assembled in memory first.
+
+    Parameters
+    ----------
+    f : TextIO
+        Open text file to write to.
+    analysis_data : dict
+        Output of :func:`analyze`.
+    entries : iterable of dict
+        Parsed JSONL traffic entries; consumed lazily.
+    input_path : str
+        Path to the source JSONL file (shown in the report header).
+    profile : AnalysisProfile
+        Provides report title, body renderers, and header redaction.
+    """
+    write = f.write
+    write(_format_summary(analysis_data, input_path, profile))
+    for line in iter_conversation_lines(entries, profile):
+        write("\n")
+        write(line)
+
+
+def _format_summary(
+    analysis_data: dict, input_path: str, profile: AnalysisProfile
+) -> str:
+    """Render the report header and statistics sections."""
     lines: list[str] = []
     lines.append(f"# {profile.report_title}")
     lines.append("")
@@ -408,6 +874,12 @@ def format_report(
             analysis_data["endpoint_methods"].get(endpoint, [])
         )
         lines.append(f"| `{endpoint}` | {methods} | {count} |")
+    omitted = analysis_data["distinct_endpoints"] - len(
+        analysis_data["endpoint_counts"]
+    )
+    if omitted > 0:
+        lines.append("")
+        lines.append(f"*{omitted} less frequent endpoints not shown.*")
     lines.append("")
 
     # HTTP methods
@@ -454,9 +926,6 @@ def format_report(
             lines.append(f"| `{key}` | {types} | {count} |")
         lines.append("")
 
-    # Full conversation log
-    lines.append(format_conversations(entries, profile))
-
     return "\n".join(lines)
 
 
@@ -507,6 +976,12 @@ def main() -> None:
         default=None,
         help="Path to write the Markdown report (default: <input_dir>/analysis_report.md)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the statistics pass (default: 1).",
+    )
     args = parser.parse_args()
 
     profile = load_analysis_profile(args.target)
@@ -520,18 +995,26 @@ def main() -> None:
         print(f"ERROR: input file not found: {input_path}", file=sys.stderr)
         sys.exit(1)
 
-    entries = load_entries(input_path)
-    if not entries:
+    # Two streaming passes over the file: statistics first (the report
+    # header needs the totals), then the conversation log.  Neither pass
+    # holds more than one entry in memory.
+    analysis_data = analyze_file(input_path, args.jobs)
+    total = analysis_data["total_requests"]
+    if not total:
         print(f"ERROR: no valid entries in {input_path}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"Loaded {len(entries)} entries from {input_path}")
-    analysis_data = analyze(entries)
-    report = format_report(analysis_data, entries, input_path, profile)
+    print(f"Loaded {total} entries from {input_path}")
+    # Cap the second pass at the counted entries in case a live capture
+    # appended to the file in between.
+    entries = resolve_blobs(
+        itertools.islice(iter_entries(input_path, warn=False), total),
+        os.path.dirname(os.path.abspath(input_path)),
+    )
 
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
     with open(output_path, "w") as f:
-        f.write(report)
+        write_report(f, analysis_data, entries, input_path, profile)
     print(f"Report written to {output_path}")
 
 
@@ -7,23 +7,58 @@ package because mitmdump runs it in its own Python environment.
 
 Output path is controlled by the ``TRAFFIC_OUTPUT_DIR`` environment
 variable.  If unset, output goes to the parent directory of this script.
+When ``TRAFFIC_OUTPUT_FD`` names an inherited ``O_APPEND`` descriptor
+(as set up by the capture runner), entries are written to it instead of
+opening ``traffic.jsonl`` here.
+
+When ``TRAFFIC_SSE_BLOBS=1``, SSE response bodies are written to
+``sse/<flow id>.sse`` next to the JSONL and the entry stores only a
+``{"__ref__": "sse/<flow id>.sse", "len": <bytes>}`` reference.
+
+Entries are buffered in memory and appended in batches through one
+long-lived ``O_APPEND`` descriptor: a batch is written once it reaches
+``FLUSH_BYTES``, after ``FLUSH_INTERVAL`` seconds, or when mitmproxy
+shuts down.  The runner starts a single mitmdump process, so each batch
+is one ``O_APPEND`` ``os.write`` from its only writer.
 
 Functions
 ---------
 load : Called by mitmproxy on addon load; logs output path.
-response : Called on each completed HTTP flow; appends to JSONL.
+response : Called on each completed HTTP flow; buffers a JSONL entry.
+done : Called by mitmproxy on shutdown; flushes buffered entries.
 """
 
-import fcntl
 import json
 import os
+import threading
 import time
 
 from mitmproxy import ctx, http
 
+try:
+    import orjson
+except ImportError:  # optional in mitmdump's environment; json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.environ.get("TRAFFIC_OUTPUT_DIR", os.path.dirname(SCRIPT_DIR))
 OUTPUT = os.path.join(OUTPUT_DIR, "traffic.jsonl")
+SSE_BLOBS = os.environ.get("TRAFFIC_SSE_BLOBS") == "1"
+
+# Flush the pending batch once it holds this many bytes ...
+FLUSH_BYTES = 64 * 1024
+# ... or this many seconds after its first entry, whichever comes first.
+FLUSH_INTERVAL = 0.5
+
+_pending = bytearray()
+_lock = threading.Lock()
+_timer = None
+# Descriptor inherited from the runner; it belongs to the runner and is
+# never closed here, so it stays valid across script reloads.
+_INHERITED_FD = (
+    int(os.environ["TRAFFIC_OUTPUT_FD"]) if "TRAFFIC_OUTPUT_FD" in os.environ else None
+)
+_fd = _INHERITED_FD
 
 
 def load(loader):  # noqa: ARG001
@@ -35,59 +70,127 @@ def response(flow: http.HTTPFlow) -> None:
     """
     Intercept a completed HTTP flow and append it to the JSONL log.
 
-    Writes one JSON object per line containing timestamp, request
+    Buffers one JSON object per line containing timestamp, request
     (method, URL, headers, body) and response (status, headers, body).
-    SSE responses are stored as raw text; JSON bodies are parsed.
-    File-level locking prevents interleaved writes when multiple
-    mitmdump instances share the same output file.
+    SSE responses are stored as raw text (or as a blob reference when
+    ``SSE_BLOBS`` is set); JSON bodies are parsed.
 
     Parameters
     ----------
     flow : mitmproxy.http.HTTPFlow
         The completed HTTP request/response flow.
     """
-    ctx.log.info(
-        f"FLOW: {flow.request.method} {flow.request.pretty_url}"
-        f" -> {flow.response.status_code}"
-    )
+    global _timer
+    # Bind once: ``content`` decodes the body and ``pretty_url`` is
+    # rebuilt on every attribute access.
+    req = flow.request
+    resp = flow.response
+    url = req.pretty_url
+    ctx.log.info(f"FLOW: {req.method} {url} -> {resp.status_code}")
 
     req_body = None
-    if flow.request.content:
+    req_content = req.content
+    if req_content:
         try:
-            req_body = json.loads(flow.request.content)
+            req_body = json.loads(req_content)
         except Exception:
-            req_body = flow.request.content.decode("utf-8", errors="replace")
+            req_body = req_content.decode("utf-8", errors="replace")
 
     resp_body = None
-    if flow.response and flow.response.content:
-        content_type = flow.response.headers.get("content-type", "")
-        if "text/event-stream" in content_type:
-            resp_body = flow.response.content.decode("utf-8", errors="replace")
+    resp_content = resp.content if resp else None
+    if resp_content:
+        content_type = resp.headers.get("content-type", "")
+        if "text/event-stream" in content_type and SSE_BLOBS:
+            resp_body = _write_sse_blob(flow.id, resp_content)
+        elif "text/event-stream" in content_type:
+            resp_body = resp_content.decode("utf-8", errors="replace")
         else:
             try:
-                resp_body = json.loads(flow.response.content)
+                resp_body = json.loads(resp_content)
             except Exception:
-                resp_body = flow.response.content.decode("utf-8", errors="replace")
+                resp_body = resp_content.decode("utf-8", errors="replace")
 
     entry = {
         "timestamp": time.time(),
         "request": {
-            "method": flow.request.method,
-            "url": flow.request.pretty_url,
-            "headers": dict(flow.request.headers),
+            "method": req.method,
+            "url": url,
+            "headers": dict(req.headers),
             "body": req_body,
         },
         "response": {
-            "status_code": flow.response.status_code if flow.response else None,
-            "headers": dict(flow.response.headers) if flow.response else None,
+            "status_code": resp.status_code if resp else None,
+            "headers": dict(resp.headers) if resp else None,
             "body": resp_body,
         },
     }
 
-    os.makedirs(os.path.dirname(OUTPUT), exist_ok=True)
-    line = json.dumps(entry) + "\n"
-    with open(OUTPUT, "a") as f:
-        fcntl.flock(f, fcntl.LOCK_EX)
-        f.write(line)
-        f.flush()
-        fcntl.flock(f, fcntl.LOCK_UN)
+    line = _encode_line(entry)
+    with _lock:
+        _pending.extend(line)
+        if len(_pending) >= FLUSH_BYTES:
+            _flush_locked()
+        elif _timer is None:
+            _timer = threading.Timer(FLUSH_INTERVAL, _flush)
+            _timer.daemon = True
+            _timer.start()
+
+
+def done():
+    """
+    Flush buffered entries on shutdown or script reload.
+
+    Only a descriptor the addon opened itself is closed; the runner's
+    inherited ``TRAFFIC_OUTPUT_FD`` is left open for its owner.
+    """
+    global _fd
+    with _lock:
+        _flush_locked()
+        if _fd is not None and _fd != _INHERITED_FD:
+            os.close(_fd)
+            _fd = _INHERITED_FD
+
+
+def _write_sse_blob(flow_id, content):
+    """Store an SSE body under ``sse/`` and return its reference dict."""
+    ref = f"sse/{flow_id}.sse"
+    path = os.path.join(OUTPUT_DIR, ref)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+    return {"__ref__": ref, "len": len(content)}
+
+
+def _encode_line(entry):
+    """Serialize *entry* as one UTF-8 JSONL line, preferring ``orjson``."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits in a parsed body
+            pass
+    return json.dumps(entry).encode() + b"\n"
+
+
+def _flush():
+    """Write out the pending batch (timer callback)."""
+    with _lock:
+        _flush_locked()
+
+
+def _flush_locked():
+    """Append the pending batch to ``OUTPUT``; caller holds ``_lock``."""
+    global _timer, _fd
+    if _timer is not None:
+        _timer.cancel()
+        _timer = None
+    if not _pending:
+        return
+    if _fd is None:
+        os.makedirs(os.path.dirname(OUTPUT), exist_ok=True)
+        _fd = os.open(OUTPUT, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    with memoryview(_pending) as view:
+        written = 0
+        while written < len(view):
+            written += os.write(_fd, view[written:])
+    _pending.clear()
@@ -1,10 +1,10 @@
 """
 Generic capture runner — launches mitmproxy reverse proxies from a CaptureProfile.
 
-Reads a target's ``CaptureProfile``, starts one ``mitmdump`` reverse
-proxy per proxy definition, and optionally runs a target command with
-environment overrides applied.  All directory paths are overridable via
-CLI arguments.
+Reads a target's ``CaptureProfile``, starts a single ``mitmdump``
+process serving one reverse-proxy listener per proxy definition, and
+optionally runs a target command with environment overrides applied.
+All directory paths are overridable via CLI arguments.
 
 Functions
 ---------
@@ -26,6 +26,7 @@ Examples
 from __future__ import annotations
 
 import argparse
+import dataclasses
 import importlib
 import os
 import shutil
@@ -62,14 +63,20 @@ def load_capture_profile(target_name: str) -> CaptureProfile:
     return module.capture_profile  # type: ignore[no-any-return]
 
 
-def run(profile: CaptureProfile, target_cmd: list[str] | None = None) -> None:
+def run(
+    profile: CaptureProfile,
+    target_cmd: list[str] | None = None,
+    *,
+    sse_blobs: bool = False,
+) -> None:
     """
     Launch reverse proxies and optionally run a target command.
 
-    Starts one ``mitmdump`` reverse proxy instance per entry in
-    ``profile.proxies``, waits for them to bind, then either runs
-    *target_cmd* with ``profile.env_overrides`` applied or blocks
-    until the user presses Ctrl-C.
+    Starts one ``mitmdump`` process with a ``reverse:<url>@<port>`` mode
+    per entry in ``profile.proxies`` (so mitmproxy is imported, and the
+    capture addon loaded, only once), waits for the listeners to bind,
+    then either runs *target_cmd* with ``profile.env_overrides`` applied
+    or blocks until the user presses Ctrl-C.
 
     Parameters
     ----------
@@ -78,6 +85,9 @@ def run(profile: CaptureProfile, target_cmd: list[str] | None = None) -> None:
     target_cmd : list of str or None, optional
         Command (and arguments) to execute under the proxies.  If
         ``None``, the runner prints instructions and waits.
+    sse_blobs : bool, optional
+        Store SSE response bodies as ``sse/*.sse`` files referenced from
+        ``traffic.jsonl`` instead of inline strings.
     """
     mitmdump = shutil.which("mitmdump")
     if not mitmdump:
@@ -107,12 +117,14 @@ def run(profile: CaptureProfile, target_cmd: list[str] | None = None) -> None:
 
     env = os.environ.copy()
     env["TRAFFIC_OUTPUT_DIR"] = output_dir
+    if sse_blobs:
+        env["TRAFFIC_SSE_BLOBS"] = "1"
 
     procs: list[subprocess.Popen[bytes]] = []
 
     def cleanup(signum: int | None = None, frame: object = None) -> None:
-        """Terminate all mitmdump child processes."""
-        print("\nStopping mitmdump instances...")
+        """Terminate the mitmdump child process."""
+        print("\nStopping mitmdump...")
         for p in procs:
             p.terminate()
         for p in procs:
@@ -123,17 +135,27 @@ def run(profile: CaptureProfile, target_cmd: list[str] | None = None) -> None:
     signal.signal(signal.SIGTERM, cleanup)
 
     try:
+        cmd = [mitmdump]
         for proxy in profile.proxies:
-            cmd = [
-                mitmdump,
-                "--mode", f"reverse:{proxy.upstream_url}",
-                "-p", str(proxy.listen_port),
-                "-s", str(ADDON_PATH),
-                "-q",
-            ]
-            if profile.upstream_proxy:
-                cmd.extend(["--set", f"upstream_proxy={profile.upstream_proxy}/"])
-            procs.append(subprocess.Popen(cmd, env=env))
+            cmd.extend(
+                ["--mode", f"reverse:{proxy.upstream_url}@{proxy.listen_port}"]
+            )
+        cmd.extend(["-s", str(ADDON_PATH), "-q"])
+        if profile.upstream_proxy:
+            cmd.extend(["--set", f"upstream_proxy={profile.upstream_proxy}/"])
+        # Open the log once here and hand the descriptor to mitmdump, so the
+        # addon appends to it directly instead of opening the file itself.
+        out_fd = os.open(
+            os.path.join(output_dir, "traffic.jsonl"),
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644,
+        )
+        env["TRAFFIC_OUTPUT_FD"] = str(out_fd)
+        try:
+            procs.append(subprocess.Popen(cmd, env=env, pass_fds=(out_fd,)))
+        finally:
+            os.close(out_fd)
+            del env["TRAFFIC_OUTPUT_FD"]
 
         time.sleep(2)
 
@@ -191,6 +213,11 @@ def main() -> None:
         default=None,
         help="Upstream proxy URL for internet access (overrides profile default).",
     )
+    parser.add_argument(
+        "--sse-blobs",
+        action="store_true",
+        help="Store SSE response bodies as separate sse/*.sse files.",
+    )
     parser.add_argument(
         "command",
         nargs="*",
@@ -200,10 +227,10 @@ def main() -> None:
 
     profile = load_capture_profile(args.target)
     if args.output_dir is not None:
-        profile.output_dir = args.output_dir
+        profile = dataclasses.replace(profile, output_dir=args.output_dir)
     if args.upstream_proxy is not None:
-        profile.upstream_proxy = args.upstream_proxy
-    run(profile, args.command or None)
+        profile = dataclasses.replace(profile, upstream_proxy=args.upstream_proxy)
+    run(profile, args.command or None, sse_blobs=args.sse_blobs)
 
 
 if __name__ == "__main__":
@@ -6,45 +6,56 @@ discrete event objects with parsed JSON data payloads.
 
 Functions
 ---------
+iter_sse_events : Lazily yield event dicts from an SSE stream string.
 parse_sse_events : Parse an SSE stream string into event dicts.
 """
 
 from __future__ import annotations
 
 import json
+import sys
+from collections.abc import Iterator
 
 
-def parse_sse_events(raw: str) -> list[dict]:
+def iter_sse_events(raw: str) -> Iterator[dict]:
     """
-    Parse an SSE stream string into a list of event dicts.
+    Lazily yield event dicts from an SSE stream string.
 
-    Each SSE block is delimited by ``\\n\\n``.  Within a block, lines
-    starting with ``event:`` set the event type and lines starting with
-    ``data:`` contribute to the data payload.  If the data is valid JSON
-    it is returned as a parsed object; otherwise it is returned as a raw
-    string.
+    Same parsing rules as :func:`parse_sse_events`, but events are
+    produced one at a time so callers that only aggregate over the
+    stream never hold the full event list in memory.  Event names are
+    interned with :func:`sys.intern`.
 
     Parameters
     ----------
     raw : str
         The raw SSE stream text.
 
-    Returns
-    -------
-    list of dict
-        Each dict has keys ``"event"`` (str) and ``"data"``
-        (parsed JSON object, raw str, or None).
+    Yields
+    ------
+    dict
+        Dicts with keys ``"event"`` (str) and ``"data"`` (parsed JSON
+        object, raw str, or None).
     """
-    events: list[dict] = []
-    for block in raw.split("\n\n"):
-        block = block.strip()
+    # Walk block boundaries with str.find so only the current block is
+    # copied, instead of splitting the whole stream into a list up front.
+    pos = 0
+    end = len(raw)
+    while pos <= end:
+        boundary = raw.find("\n\n", pos)
+        if boundary < 0:
+            boundary = end
+        block = raw[pos:boundary].strip()
+        pos = boundary + 2
         if not block:
             continue
         event_type = ""
         data_lines: list[str] = []
         for line in block.split("\n"):
             if line.startswith("event: "):
-                event_type = line[7:]
+                # Event names repeat across the stream; interning shares one
+                # string per name and lets dispatch tables match by identity.
+                event_type = sys.intern(line[7:])
             elif line.startswith("data: "):
                 data_lines.append(line[6:])
             elif line.startswith("data:"):
@@ -57,5 +68,28 @@ def parse_sse_events(raw: str) -> list[dict]:
                     data = json.loads(data_str)
                 except json.JSONDecodeError:
                     data = data_str
-            events.append({"event": event_type, "data": data})
-    return events
+            yield {"event": event_type, "data": data}
+
+
+def parse_sse_events(raw: str) -> list[dict]:
+    """
+    Parse an SSE stream string into a list of event dicts.
+
+    Each SSE block is delimited by ``\\n\\n``.  Within a block, lines
+    starting with ``event:`` set the event type and lines starting with
+    ``data:`` contribute to the data payload.  If the data is valid JSON
+    it is returned as a parsed object; otherwise it is returned as a raw
+    string.
+
+    Parameters
+    ----------
+    raw : str
+        The raw SSE stream text.
+
+    Returns
+    -------
+    list of dict
+        Each dict has keys ``"event"`` (str) and ``"data"``
+        (parsed JSON object, raw str, or None).
+    """
+    return list(iter_sse_events(raw))
@@ -3,7 +3,9 @@ Profile types for traffic capture and analysis tools.
 
 Defines the data structures used to configure generic traffic capture
 and analysis tools for any target agent system.  Target-specific modules
-provide instances of these profiles; the tools consume them.
+provide instances of these profiles; the tools consume them.  Profiles
+are frozen, slotted dataclasses: tools that need a variant (e.g. a CLI
+override) derive one with :func:`dataclasses.replace`.
 
 Classes
 -------
@@ -19,7 +21,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProxyConfig:
     """
     Configuration for a single mitmproxy reverse proxy instance.
@@ -39,7 +41,7 @@ class ProxyConfig:
     purpose: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CaptureProfile:
     """
     Describes how to set up traffic capture for a target agent system.
@@ -69,7 +71,7 @@ class CaptureProfile:
     output_dir: str = "tmp/traffic"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnalysisProfile:
     """
     Describes how to analyze and render traffic for a target agent system.
@@ -85,14 +87,14 @@ class AnalysisProfile:
     response_body_renderer : callable
         ``(body: Any, status_code: int) -> str`` — renders a response body
         as Markdown.
-    redacted_headers : set of str
-        Header names whose values are redacted in the report.
+    redacted_headers : frozenset of str
+        Lowercase header names whose values are redacted in the report.
     """
 
     name: str
     report_title: str
     request_body_renderer: Callable[[Any], str]
     response_body_renderer: Callable[[Any, int], str]
-    redacted_headers: set[str] = field(
-        default_factory=lambda: {"authorization", "cookie", "set-cookie"}
+    redacted_headers: frozenset[str] = frozenset(
+        {"authorization", "cookie", "set-cookie"}
     )
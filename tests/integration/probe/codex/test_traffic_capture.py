@@ -4,7 +4,12 @@ This is a mitmproxy addon for manual testing — load via:
     mitmdump -p 8080 --mode reverse:https://api.openai.com/ -s test_traffic_capture.py
 
 It verifies that the capture addon's JSONL format is correct by logging
-a summary of each captured flow.
+a summary of each captured flow.  Lines are collected in memory and
+appended with ``os.write`` on one ``O_APPEND`` descriptor (opened in
+``load``) every ``BATCH_SIZE`` flows and on shutdown.  Bodies larger
+than ``BODY_INLINE_MAX`` bytes are written raw to
+``bodies/<flow id>.<side>.bin`` and referenced from the entry as
+``{"__ref__": ..., "len": ...}``, the capture addon's blob format.
 """
 
 import json
@@ -13,35 +18,89 @@ import time
 
 from mitmproxy import ctx, http
 
+try:
+    import orjson
+except ImportError:  # optional in mitmdump's environment; json is the fallback
+    orjson = None
+
 OUTPUT = os.path.join(os.getcwd(), "tmp/codex-traffic/traffic.jsonl")
+BATCH_SIZE = 32
+BODY_INLINE_MAX = 64 * 1024
+
+_fd = None
+_buf: list[bytes] = []
+
+
+def load(loader) -> None:  # noqa: ARG001
+    global _fd
+    _fd = os.open(OUTPUT, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
 
 
 def response(flow: http.HTTPFlow) -> None:
-    ctx.log.info(
-        f"CAPTURED: {flow.request.method} {flow.request.pretty_url}"
-        f" -> {flow.response.status_code}"
-    )
+    req = flow.request
+    resp = flow.response
+    url = req.pretty_url
+    ctx.log.info(f"CAPTURED: {req.method} {url} -> {resp.status_code}")
     entry = {
         "timestamp": time.time(),
         "request": {
-            "method": flow.request.method,
-            "url": flow.request.pretty_url,
-            "headers": dict(flow.request.headers),
-            "body": (
-                flow.request.content.decode("utf-8", errors="replace")
-                if flow.request.content
-                else None
-            ),
+            "method": req.method,
+            "url": url,
+            "headers": dict(req.headers),
+            "body": _body(req.content, flow.id, "request"),
         },
         "response": {
-            "status_code": flow.response.status_code if flow.response else None,
-            "headers": dict(flow.response.headers) if flow.response else None,
-            "body": (
-                flow.response.content.decode("utf-8", errors="replace")
-                if flow.response and flow.response.content
-                else None
-            ),
+            "status_code": resp.status_code if resp else None,
+            "headers": dict(resp.headers) if resp else None,
+            "body": _body(resp.content, flow.id, "response") if resp else None,
         },
     }
-    with open(OUTPUT, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _buf.append(_encode_line(entry))
+    if len(_buf) >= BATCH_SIZE:
+        _flush()
+
+
+def done() -> None:
+    global _fd
+    _flush()
+    if _fd is not None:
+        os.close(_fd)
+        _fd = None
+
+
+def _body(content: bytes | None, flow_id: str, side: str) -> str | dict | None:
+    """
+    Return *content* as UTF-8 text, invalid bytes replaced with U+FFFD.
+
+    Bodies over ``BODY_INLINE_MAX`` bytes are stored in a side file and
+    returned as a blob reference instead, without being decoded.
+    """
+    if not content:
+        return None
+    if len(content) > BODY_INLINE_MAX:
+        ref = f"bodies/{flow_id}.{side}.bin"
+        path = os.path.join(os.path.dirname(OUTPUT), ref)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+        return {"__ref__": ref, "len": len(content)}
+    return content.decode("utf-8", errors="replace")
+
+
+def _encode_line(entry: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates in header values
+            pass
+    return json.dumps(entry).encode() + b"\n"
+
+
+def _flush() -> None:
+    if _buf and _fd is not None:
+        with memoryview(b"".join(_buf)) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(_fd, view[written:])
+        _buf.clear()